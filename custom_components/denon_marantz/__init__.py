@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import asdict
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
@@ -7,22 +10,36 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_ALLOW_TIMEOUT,
     CONF_ADD_EXTENDED_ENTITIES,
+    CONF_CAPABILITIES,
+    CONF_CONTINUOUS_WRITE_INTERVAL,
     CONF_INPUT_FILTER,
+    CONF_MAX_RESPONSE_TIMEOUT,
+    CONF_MIN_RESPONSE_TIMEOUT,
     DEFAULT_ADD_EXTENDED_ENTITIES,
+    DEFAULT_CONTINUOUS_WRITE_INTERVAL,
     DEFAULT_INPUT_FILTER,
+    DEFAULT_MAX_RESPONSE_TIMEOUT,
+    DEFAULT_MIN_RESPONSE_TIMEOUT,
     ATTR_COMMAND,
+    ATTR_COMMANDS,
     ATTR_ENTRY_ID,
     ATTR_EXPECTED_PREFIXES,
     ATTR_TIMEOUT,
     DOMAIN,
+    SERVICE_PROBE_CAPABILITIES,
     SERVICE_SEND_COMMAND,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
+    STORAGE_VERSION,
 )
-from .coordinator import DenonMarantzDataUpdateCoordinator
-from .denon_protocol import DenonMarantzClient
+from .coordinator import DenonMarantzDataUpdateCoordinator, PollingIntervals
+from .denon_protocol import CommandRequest, DenonMarantzClient
 
 PLATFORMS: list[Platform] = [
     Platform.MEDIA_PLAYER,
@@ -32,11 +49,10 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
-SEND_COMMAND_SCHEMA = vol.Schema(
+BATCH_COMMAND_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_COMMAND): cv.string,
-        vol.Optional(ATTR_ENTRY_ID): cv.string,
-        vol.Optional(ATTR_TIMEOUT, default=2.0): vol.Coerce(float),
+        vol.Optional(ATTR_TIMEOUT): vol.Coerce(float),
         vol.Optional(ATTR_EXPECTED_PREFIXES, default=[]): vol.All(
             cv.ensure_list,
             [cv.string],
@@ -45,11 +61,36 @@ SEND_COMMAND_SCHEMA = vol.Schema(
     }
 )
 
+SEND_COMMAND_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_COMMAND, ATTR_COMMAND): cv.string,
+            vol.Exclusive(ATTR_COMMANDS, ATTR_COMMAND): vol.All(
+                cv.ensure_list,
+                vol.Length(min=1),
+                [vol.Any(vol.All(cv.string, lambda value: {ATTR_COMMAND: value}), dict)],
+                [BATCH_COMMAND_SCHEMA],
+            ),
+            vol.Optional(ATTR_ENTRY_ID): cv.string,
+            vol.Optional(ATTR_TIMEOUT): vol.Coerce(float),
+            vol.Optional(ATTR_EXPECTED_PREFIXES, default=[]): vol.All(
+                cv.ensure_list,
+                [cv.string],
+            ),
+            vol.Optional(ATTR_ALLOW_TIMEOUT): bool,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_COMMAND, ATTR_COMMANDS),
+)
 
-async def _async_handle_send_command_service(
-    hass: HomeAssistant,
-    call: ServiceCall,
-) -> dict[str, str]:
+ENTRY_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+    }
+)
+
+
+def _resolve_loaded_entry(hass: HomeAssistant, call: ServiceCall) -> tuple[str, dict]:
     domain_data: dict = hass.data.get(DOMAIN, {})
     entries = {
         entry_id: entry_data
@@ -72,32 +113,76 @@ async def _async_handle_send_command_service(
             )
         selected_entry_id = next(iter(entries))
 
-    client: DenonMarantzClient = entries[selected_entry_id]["client"]
+    return selected_entry_id, entries[selected_entry_id]
+
 
-    command = str(call.data[ATTR_COMMAND]).strip()
+def _command_request(data: dict[str, Any], defaults: dict[str, Any]) -> CommandRequest:
+    command = str(data[ATTR_COMMAND]).strip()
     if not command:
         raise HomeAssistantError("Service data 'command' must not be empty")
 
-    timeout = float(call.data.get(ATTR_TIMEOUT, 2.0))
-    if timeout <= 0:
+    timeout: float | None = data.get(ATTR_TIMEOUT, defaults.get(ATTR_TIMEOUT))
+    if timeout is not None and timeout <= 0:
         raise HomeAssistantError("Service data 'timeout' must be greater than 0")
 
     expected_prefixes = tuple(
-        prefix.strip() for prefix in call.data.get(ATTR_EXPECTED_PREFIXES, []) if prefix.strip()
+        prefix.strip() for prefix in data.get(ATTR_EXPECTED_PREFIXES, []) if prefix.strip()
     )
 
-    allow_timeout_value = call.data.get(ATTR_ALLOW_TIMEOUT)
+    allow_timeout_value = data.get(ATTR_ALLOW_TIMEOUT, defaults.get(ATTR_ALLOW_TIMEOUT))
     if allow_timeout_value is None:
         allow_timeout = not command.endswith("?") and not expected_prefixes
     else:
         allow_timeout = bool(allow_timeout_value)
 
+    return CommandRequest(command, timeout, expected_prefixes or None, allow_timeout)
+
+
+async def _async_refresh_unconfirmed_fields(
+    entry_data: dict,
+    replies: list[tuple[str, str | None]],
+) -> None:
+    client: DenonMarantzClient = entry_data["client"]
+    coordinator: DenonMarantzDataUpdateCoordinator = entry_data["coordinator"]
+
+    fields = {
+        field
+        for command, response in replies
+        if not response and (field := client.status_field_for_command(command)) is not None
+    }
+    if "power" in fields:
+        await coordinator.async_request_refresh()
+    elif fields:
+        await coordinator.async_refresh_fields(fields)
+
+
+async def _async_handle_send_command_service(
+    hass: HomeAssistant,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    selected_entry_id, entry_data = _resolve_loaded_entry(hass, call)
+    client: DenonMarantzClient = entry_data["client"]
+
+    if ATTR_COMMANDS in call.data:
+        requests = [_command_request(item, call.data) for item in call.data[ATTR_COMMANDS]]
+        results = await client.async_send_commands(requests)
+        await _async_refresh_unconfirmed_fields(
+            entry_data,
+            [(result.command, result.response) for result in results],
+        )
+        return {
+            "entry_id": selected_entry_id,
+            "results": [asdict(result) for result in results],
+        }
+
+    request = _command_request(call.data, {})
     response = await client.async_send_command(
-        command=command,
-        timeout=timeout,
-        expected_prefixes=expected_prefixes or None,
-        allow_timeout=allow_timeout,
+        command=request.command,
+        timeout=request.timeout,
+        expected_prefixes=request.expected_prefixes,
+        allow_timeout=request.allow_timeout,
     )
+    await _async_refresh_unconfirmed_fields(entry_data, [(request.command, response)])
 
     return {
         "entry_id": selected_entry_id,
@@ -105,11 +190,71 @@ async def _async_handle_send_command_service(
     }
 
 
+async def _async_handle_probe_capabilities_service(
+    hass: HomeAssistant,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    selected_entry_id, entry_data = _resolve_loaded_entry(hass, call)
+    client: DenonMarantzClient = entry_data["client"]
+
+    capabilities = await client.async_probe_capabilities()
+    if capabilities is None:
+        raise HomeAssistantError("The AVR must be powered on to probe its capabilities")
+
+    entry = hass.config_entries.async_get_entry(selected_entry_id)
+    if entry is not None and entry.data.get(CONF_CAPABILITIES) != capabilities:
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_CAPABILITIES: capabilities},
+        )
+
+    return {
+        "entry_id": selected_entry_id,
+        "capabilities": capabilities,
+    }
+
+
+async def _async_handle_start_capture_service(
+    hass: HomeAssistant,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    selected_entry_id, entry_data = _resolve_loaded_entry(hass, call)
+    client: DenonMarantzClient = entry_data["client"]
+
+    timestamp = dt_util.utcnow().strftime("%Y%m%dT%H%M%S")
+    path = hass.config.path(f"{DOMAIN}_capture_{selected_entry_id}_{timestamp}.jsonl")
+    try:
+        await client.async_start_capture(path)
+    except OSError as err:
+        raise HomeAssistantError(f"Could not open capture file {path}: {err}") from err
+
+    return {
+        "entry_id": selected_entry_id,
+        "path": path,
+    }
+
+
+async def _async_handle_stop_capture_service(
+    hass: HomeAssistant,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    selected_entry_id, entry_data = _resolve_loaded_entry(hass, call)
+    client: DenonMarantzClient = entry_data["client"]
+
+    path = client.capture_path
+    client.stop_capture()
+
+    return {
+        "entry_id": selected_entry_id,
+        "path": path,
+    }
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     if not hass.services.has_service(DOMAIN, SERVICE_SEND_COMMAND):
-        async def _handle_send_command_service(call: ServiceCall) -> dict[str, str]:
+        async def _handle_send_command_service(call: ServiceCall) -> dict[str, Any]:
             return await _async_handle_send_command_service(hass, call)
 
         hass.services.async_register(
@@ -120,6 +265,42 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             supports_response=SupportsResponse.OPTIONAL,
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_PROBE_CAPABILITIES):
+        async def _handle_probe_capabilities_service(call: ServiceCall) -> dict[str, Any]:
+            return await _async_handle_probe_capabilities_service(hass, call)
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROBE_CAPABILITIES,
+            _handle_probe_capabilities_service,
+            schema=ENTRY_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_START_CAPTURE):
+        async def _handle_start_capture_service(call: ServiceCall) -> dict[str, Any]:
+            return await _async_handle_start_capture_service(hass, call)
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_START_CAPTURE,
+            _handle_start_capture_service,
+            schema=ENTRY_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_STOP_CAPTURE):
+        async def _handle_stop_capture_service(call: ServiceCall) -> dict[str, Any]:
+            return await _async_handle_stop_capture_service(hass, call)
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_STOP_CAPTURE,
+            _handle_stop_capture_service,
+            schema=ENTRY_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
     return True
 
 
@@ -133,9 +314,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             entry.options.get(CONF_ADD_EXTENDED_ENTITIES, DEFAULT_ADD_EXTENDED_ENTITIES)
         ),
         input_filter=str(entry.options.get(CONF_INPUT_FILTER, DEFAULT_INPUT_FILTER)),
+        continuous_write_interval=float(
+            entry.options.get(CONF_CONTINUOUS_WRITE_INTERVAL, DEFAULT_CONTINUOUS_WRITE_INTERVAL)
+        ),
+        capabilities=entry.data.get(CONF_CAPABILITIES),
+        min_response_timeout=float(
+            entry.options.get(CONF_MIN_RESPONSE_TIMEOUT, DEFAULT_MIN_RESPONSE_TIMEOUT)
+        ),
+        max_response_timeout=float(
+            entry.options.get(CONF_MAX_RESPONSE_TIMEOUT, DEFAULT_MAX_RESPONSE_TIMEOUT)
+        ),
     )
-    coordinator = DenonMarantzDataUpdateCoordinator(hass, client)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = DenonMarantzDataUpdateCoordinator(
+        hass,
+        client,
+        PollingIntervals.from_options(entry.options),
+        _snapshot_store(hass, entry),
+    )
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
+
+    entry.async_on_unload(client.add_status_listener(coordinator.async_handle_pushed_status))
+    entry.async_on_unload(client.add_disconnect_listener(coordinator.async_handle_disconnect))
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    if restored:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} initial refresh {entry.entry_id}",
+        )
 
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
@@ -146,6 +355,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
@@ -154,3 +371,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await client.disconnect()
 
     return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await _snapshot_store(hass, entry).async_remove()
@@ -53,7 +53,7 @@ class DenonMarantzControlButton(
         translation_key: str,
         action: ControlAction,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset())
         self._action = action
         self._attr_translation_key = translation_key
         self._attr_unique_id = f"{entry.entry_id}_{translation_key}"
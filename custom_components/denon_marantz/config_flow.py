@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from urllib.parse import urlparse
 
@@ -12,15 +13,34 @@ from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
+    CAPABILITY_PROBE_TIMEOUT,
     CONF_ADD_EXTENDED_ENTITIES,
+    CONF_CAPABILITIES,
+    CONF_CONTINUOUS_WRITE_INTERVAL,
+    CONF_FAST_SCAN_INTERVAL,
     CONF_INPUT_FILTER,
+    CONF_MAX_BACKOFF_INTERVAL,
+    CONF_MAX_RESPONSE_TIMEOUT,
+    CONF_MIN_RESPONSE_TIMEOUT,
     CONF_PORT,
+    CONF_PUSH_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONF_STANDBY_SCAN_INTERVAL,
     DEFAULT_ADD_EXTENDED_ENTITIES,
+    DEFAULT_CONTINUOUS_WRITE_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL,
     DEFAULT_INPUT_FILTER,
+    DEFAULT_MAX_BACKOFF_INTERVAL,
+    DEFAULT_MAX_RESPONSE_TIMEOUT,
+    DEFAULT_MIN_RESPONSE_TIMEOUT,
     DEFAULT_NAME,
     DEFAULT_PORT,
+    DEFAULT_PUSH_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STANDBY_SCAN_INTERVAL,
     DOMAIN,
 )
+from .denon_protocol import DenonMarantzClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,11 +58,18 @@ class DenonMarantzConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_name: str | None = None
 
     async def async_step_user(self, user_input: dict | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
         if user_input is not None:
             self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
             await self.async_set_unique_id(user_input[CONF_HOST])
             self._abort_if_unique_id_configured()
-            return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
+            try:
+                entry_data = await self._async_with_capabilities(user_input)
+            except (ConnectionError, OSError, TimeoutError) as err:
+                _LOGGER.debug("Unable to connect to %s: %s", user_input[CONF_HOST], err)
+                errors["base"] = "cannot_connect"
+            else:
+                return self.async_create_entry(title=user_input[CONF_NAME], data=entry_data)
 
         schema = vol.Schema(
             {
@@ -51,7 +78,7 @@ class DenonMarantzConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
             }
         )
-        return self.async_show_form(step_id="user", data_schema=schema)
+        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
     async def async_step_ssdp(self, discovery_info: ssdp.SsdpServiceInfo) -> FlowResult:
         st = self._get_ssdp_value(discovery_info, ssdp.ATTR_SSDP_ST, "ssdp_st")
@@ -134,6 +161,7 @@ class DenonMarantzConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return await self.async_step_confirm()
 
     async def async_step_confirm(self, user_input: dict | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
         if user_input is not None:
             if not self._discovered_host:
                 _LOGGER.debug("Discovery confirm failed: no discovered host in flow state")
@@ -144,7 +172,13 @@ class DenonMarantzConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_HOST: self._discovered_host,
                 CONF_PORT: DEFAULT_PORT,
             }
-            return self.async_create_entry(title=entry_data[CONF_NAME], data=entry_data)
+            try:
+                entry_data = await self._async_with_capabilities(entry_data)
+            except (ConnectionError, OSError, TimeoutError) as err:
+                _LOGGER.debug("Unable to connect to %s: %s", self._discovered_host, err)
+                errors["base"] = "cannot_connect"
+            else:
+                return self.async_create_entry(title=entry_data[CONF_NAME], data=entry_data)
 
         self.context["title_placeholders"] = {
             "name": self._discovered_name or DEFAULT_NAME,
@@ -157,8 +191,22 @@ class DenonMarantzConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "name": self._discovered_name or DEFAULT_NAME,
                 "host": self._discovered_host or "",
             },
+            errors=errors,
         )
 
+    async def _async_with_capabilities(self, entry_data: dict) -> dict:
+        client = DenonMarantzClient(host=entry_data[CONF_HOST], port=entry_data[CONF_PORT])
+        try:
+            async with asyncio.timeout(CAPABILITY_PROBE_TIMEOUT):
+                await client.connect()
+                capabilities = await client.async_probe_capabilities()
+        finally:
+            await client.disconnect()
+
+        if capabilities is None:
+            return entry_data
+        return {**entry_data, CONF_CAPABILITIES: capabilities}
+
     @staticmethod
     def _get_ssdp_value(
         discovery_info: ssdp.SsdpServiceInfo,
@@ -228,6 +276,36 @@ class DenonMarantzOptionsFlow(config_entries.OptionsFlow):
                         DEFAULT_INPUT_FILTER,
                     ),
                 ): str,
+                vol.Optional(
+                    CONF_CONTINUOUS_WRITE_INTERVAL,
+                    default=self._config_entry.options.get(
+                        CONF_CONTINUOUS_WRITE_INTERVAL,
+                        DEFAULT_CONTINUOUS_WRITE_INTERVAL,
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=2.0)),
+                **{
+                    vol.Optional(
+                        key,
+                        default=self._config_entry.options.get(key, default),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=3600))
+                    for key, default in (
+                        (CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                        (CONF_PUSH_SCAN_INTERVAL, DEFAULT_PUSH_SCAN_INTERVAL),
+                        (CONF_STANDBY_SCAN_INTERVAL, DEFAULT_STANDBY_SCAN_INTERVAL),
+                        (CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL),
+                        (CONF_MAX_BACKOFF_INTERVAL, DEFAULT_MAX_BACKOFF_INTERVAL),
+                    )
+                },
+                **{
+                    vol.Optional(
+                        key,
+                        default=self._config_entry.options.get(key, default),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.05, max=30))
+                    for key, default in (
+                        (CONF_MIN_RESPONSE_TIMEOUT, DEFAULT_MIN_RESPONSE_TIMEOUT),
+                        (CONF_MAX_RESPONSE_TIMEOUT, DEFAULT_MAX_RESPONSE_TIMEOUT),
+                    )
+                },
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -5,11 +5,52 @@ DEFAULT_PORT = 23
 CONF_PORT = "port"
 CONF_ADD_EXTENDED_ENTITIES = "add_extended_entities"
 CONF_INPUT_FILTER = "input_filter"
+CONF_CONTINUOUS_WRITE_INTERVAL = "continuous_write_interval"
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_PUSH_SCAN_INTERVAL = "push_scan_interval"
+CONF_STANDBY_SCAN_INTERVAL = "standby_scan_interval"
+CONF_FAST_SCAN_INTERVAL = "fast_scan_interval"
+CONF_MAX_BACKOFF_INTERVAL = "max_backoff_interval"
+CONF_CAPABILITIES = "capabilities"
+CONF_MIN_RESPONSE_TIMEOUT = "min_response_timeout"
+CONF_MAX_RESPONSE_TIMEOUT = "max_response_timeout"
 DEFAULT_ADD_EXTENDED_ENTITIES = False
 DEFAULT_INPUT_FILTER = ""
+DEFAULT_CONTINUOUS_WRITE_INTERVAL = 0.15
+DEFAULT_SCAN_INTERVAL = 5
+DEFAULT_PUSH_SCAN_INTERVAL = 60
+DEFAULT_STANDBY_SCAN_INTERVAL = 60
+DEFAULT_FAST_SCAN_INTERVAL = 1
+DEFAULT_MAX_BACKOFF_INTERVAL = 300
+FAST_SCAN_WINDOW = 15
+DEFAULT_MIN_RESPONSE_TIMEOUT = 0.2
+DEFAULT_MAX_RESPONSE_TIMEOUT = 5.0
+DEFAULT_RESPONSE_TIMEOUT = 2.0
+FAMILY_MIN_RESPONSE_TIMEOUTS: dict[str, float] = {
+	"PW": 1.0,
+}
+SOURCE_MAP_RESPONSE_TIMEOUT = 2.5
+CONNECT_TIMEOUT = 10.0
+CAPABILITY_PROBE_TIMEOUT = 45.0
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
+MIN_COMMAND_INTERVAL = 0.05
+QUERY_FAILURE_THRESHOLD = 3
+QUERY_REPROBE_INTERVAL = 300
+QUERY_MAX_REPROBE_INTERVAL = 21600
+LATENCY_HISTOGRAM_BUCKETS: tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+PROTOCOL_TRACE_SIZE = 256
+CAPTURE_FORMAT = "denon_marantz-capture"
+CAPTURE_VERSION = 1
 
 SERVICE_SEND_COMMAND = "send_command"
+SERVICE_PROBE_CAPABILITIES = "probe_capabilities"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
 ATTR_COMMAND = "command"
+ATTR_COMMANDS = "commands"
 ATTR_ENTRY_ID = "entry_id"
 ATTR_TIMEOUT = "timeout"
 ATTR_EXPECTED_PREFIXES = "expected_prefixes"
@@ -37,26 +78,58 @@ DEFAULT_INPUT_SOURCES: list[str] = [
 	"TUNER",
 ]
 
-STATUS_SENSOR_COMMANDS: tuple[tuple[str, str, str], ...] = (
-	("cinema_eq_status", "PSCINEMA EQ ?", "PSCINEMA EQ"),
-	("multi_eq_status", "PSMULTEQ ?", "PSMULTEQ"),
+REFRESH_TIER_HOT = "hot"
+REFRESH_TIER_WARM = "warm"
+REFRESH_TIER_COLD = "cold"
+REFRESH_TIER_PERIODS: dict[str, float] = {
+	REFRESH_TIER_HOT: 0.0,
+	REFRESH_TIER_WARM: 60.0,
+	REFRESH_TIER_COLD: 600.0,
+}
+RELATED_REFRESH_DELAY = 1.0
+
+CINEMA_EQ_QUERY_COMMAND = "PSCINEMA EQ ?"
+MULTI_EQ_QUERY_COMMAND = "PSMULTEQ ?"
+
+STATUS_SENSOR_COMMANDS: tuple[tuple[str, str, str, str], ...] = (
+	("cinema_eq_status", CINEMA_EQ_QUERY_COMMAND, "PSCINEMA EQ", REFRESH_TIER_COLD),
+	("multi_eq_status", MULTI_EQ_QUERY_COMMAND, "PSMULTEQ", REFRESH_TIER_COLD),
 )
 
 DYNAMIC_EQ_QUERY_COMMAND = "PSDYNEQ ?"
 DYNAMIC_EQ_RESPONSE_PREFIX = "PSDYNEQ"
+DYNAMIC_EQ_REFRESH_TIER = REFRESH_TIER_WARM
 
 DYNAMIC_VOLUME_QUERY_COMMAND = "PSDYNVOL ?"
 DYNAMIC_VOLUME_RESPONSE_PREFIX = "PSDYNVOL"
+DYNAMIC_VOLUME_REFRESH_TIER = REFRESH_TIER_WARM
 DYNAMIC_VOLUME_OPTIONS: list[str] = ["Off", "Light", "Medium", "Heavy"]
 
 DIALOGUE_ENHANCER_QUERY_COMMAND = "PSDIL ?"
 DIALOGUE_ENHANCER_RESPONSE_PREFIX = "PSDIL"
+DIALOGUE_ENHANCER_REFRESH_TIER = REFRESH_TIER_WARM
 DIALOGUE_ENHANCER_OPTIONS: list[str] = ["Off", "Low", "Medium", "High"]
 
 DYNAMIC_COMPRESSION_QUERY_COMMAND = "PSDRC ?"
 DYNAMIC_COMPRESSION_RESPONSE_PREFIX = "PSDRC"
+DYNAMIC_COMPRESSION_REFRESH_TIER = REFRESH_TIER_COLD
 DYNAMIC_COMPRESSION_OPTIONS: list[str] = ["Off", "Auto", "Low", "Medium", "High"]
 
 LOUDNESS_QUERY_COMMAND = "PSLOM ?"
 LOUDNESS_RESPONSE_PREFIX = "PSLOM"
+LOUDNESS_REFRESH_TIER = REFRESH_TIER_COLD
 LOUDNESS_OPTIONS: list[str] = ["Off", "On"]
+
+RELATED_QUERY_INVALIDATIONS: dict[str, tuple[str, ...]] = {
+	"SI": (
+		MULTI_EQ_QUERY_COMMAND,
+		DYNAMIC_EQ_QUERY_COMMAND,
+		DYNAMIC_VOLUME_QUERY_COMMAND,
+	),
+	"MS": (
+		CINEMA_EQ_QUERY_COMMAND,
+		DIALOGUE_ENHANCER_QUERY_COMMAND,
+		DYNAMIC_COMPRESSION_QUERY_COMMAND,
+		LOUDNESS_QUERY_COMMAND,
+	),
+}
@@ -1,35 +1,120 @@
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
-from .denon_protocol import DenonMarantzClient
+from .const import (
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_MAX_BACKOFF_INTERVAL,
+    CONF_PUSH_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL,
+    CONF_STANDBY_SCAN_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_MAX_BACKOFF_INTERVAL,
+    DEFAULT_PUSH_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STANDBY_SCAN_INTERVAL,
+    DOMAIN,
+    FAST_SCAN_WINDOW,
+    STORAGE_SAVE_DELAY,
+)
+from .denon_protocol import AvrStatus, DenonMarantzClient
 
+OPTIMISTIC_CONFIRM_DELAY = 1.0
+FIELD_REFRESH_COALESCE_DELAY = 0.05
 
-class DenonMarantzDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    def __init__(self, hass: HomeAssistant, client: DenonMarantzClient) -> None:
+_UNKNOWN = object()
+
+
+@dataclass(frozen=True, slots=True)
+class PollingIntervals:
+    scan: timedelta = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    push: timedelta = timedelta(seconds=DEFAULT_PUSH_SCAN_INTERVAL)
+    standby: timedelta = timedelta(seconds=DEFAULT_STANDBY_SCAN_INTERVAL)
+    fast: timedelta = timedelta(seconds=DEFAULT_FAST_SCAN_INTERVAL)
+    max_backoff: timedelta = timedelta(seconds=DEFAULT_MAX_BACKOFF_INTERVAL)
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> PollingIntervals:
+        def _seconds(key: str, default: float) -> timedelta:
+            return timedelta(seconds=float(options.get(key, default)))
+
+        return cls(
+            scan=_seconds(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            push=_seconds(CONF_PUSH_SCAN_INTERVAL, DEFAULT_PUSH_SCAN_INTERVAL),
+            standby=_seconds(CONF_STANDBY_SCAN_INTERVAL, DEFAULT_STANDBY_SCAN_INTERVAL),
+            fast=_seconds(CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL),
+            max_backoff=_seconds(CONF_MAX_BACKOFF_INTERVAL, DEFAULT_MAX_BACKOFF_INTERVAL),
+        )
+
+
+class DenonMarantzDataUpdateCoordinator(DataUpdateCoordinator[AvrStatus]):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: DenonMarantzClient,
+        intervals: PollingIntervals | None = None,
+        store: Store[dict[str, Any]] | None = None,
+    ) -> None:
+        self.intervals = intervals or PollingIntervals()
         super().__init__(
             hass,
             logger=client.logger,
             name=DOMAIN,
-            update_interval=timedelta(seconds=5),
+            update_interval=self.intervals.scan,
+            always_update=False,
         )
         self.client = client
-        self._last_successful_data: dict[str, Any] | None = None
+        self._store = store
+        self._save_scheduled = False
+        self._saved_source_version = client.source_index.version
+        self._dispatched_source_version = client.source_index.version
+        self._fast_scan_until = 0.0
+        self._last_successful_data: AvrStatus | None = None
+        self._dispatched: tuple[AvrStatus | None, bool] = (None, False)
         self._consecutive_failures = 0
+        self._optimistic: dict[str, tuple[Any, Any]] = {}
+        self._unsub_confirm: CALLBACK_TYPE | None = None
+        self._queued_fields: set[str] = set()
+        self._field_fetch: asyncio.Task[dict[str, Any]] | None = None
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> AvrStatus:
         try:
             data = await self.client.async_get_status()
+            polled = self.client.polled_fields
+            self._optimistic = {
+                field: pending
+                for field, pending in self._optimistic.items()
+                if field not in polled
+            }
+            optimistic = {
+                field: value
+                for field, (value, _) in self._optimistic.items()
+                if value is not _UNKNOWN
+            }
+            if optimistic:
+                data = replace(data, **optimistic)
             self._last_successful_data = data
             self._consecutive_failures = 0
+            self.update_interval = self._next_update_interval(data)
+            if self.client.source_index.version != self._saved_source_version:
+                self._async_schedule_save()
+            if self.client.source_index.version != self._dispatched_source_version:
+                # An unchanged status skips the listener update, but the
+                # source lists still need to pick up the new index.
+                self.hass.loop.call_soon(self.async_update_listeners)
             return data
         except Exception as err:
             self._consecutive_failures += 1
+            self.update_interval = self._next_update_interval(self._last_successful_data)
             if self._last_successful_data is not None:
                 self.logger.warning(
                     "AVR update failed (%s). Returning cached state after %s consecutive failure(s).",
@@ -38,3 +123,213 @@ class DenonMarantzDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
                 return self._last_successful_data
             raise UpdateFailed(f"Failed to fetch AVR state: {err}") from err
+
+    def _next_update_interval(self, data: AvrStatus | None) -> timedelta:
+        if self._consecutive_failures:
+            backoff = self.intervals.scan * (2 ** (self._consecutive_failures - 1))
+            return min(backoff, self.intervals.max_backoff)
+        if self.hass.loop.time() < self._fast_scan_until:
+            return self.intervals.fast
+        if data is None or data.power != "ON":
+            return self.intervals.standby
+        if self.client.push_connected:
+            return self.intervals.push
+        return self.intervals.scan
+
+    @callback
+    def async_update_listeners(self) -> None:
+        previous, previous_success = self._dispatched
+        self._dispatched = (self.data, self.last_update_success)
+        source_version = self.client.source_index.version
+        source_changed = source_version != self._dispatched_source_version
+        self._dispatched_source_version = source_version
+
+        changed: frozenset[str] | None = None
+        if (
+            previous is not None
+            and self.data is not None
+            and previous_success == self.last_update_success
+        ):
+            changed = previous.diff(self.data)
+            if source_changed:
+                changed |= {"source"}
+            if not changed:
+                return
+
+        if self.data is not None:
+            self._async_schedule_save()
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    async def async_restore_snapshot(self) -> bool:
+        if self._store is None:
+            return False
+
+        cached = await self._store.async_load()
+        if not cached or not isinstance(cached.get("status"), dict):
+            return False
+
+        status = AvrStatus(
+            **{
+                name: value
+                for name, value in cached["status"].items()
+                if name in AvrStatus.__slots__
+            }
+        )
+        self.client.restore(status, cached.get("source_map") or {})
+        self._saved_source_version = self.client.source_index.version
+        self._dispatched_source_version = self.client.source_index.version
+        self._dispatched = (status, True)
+        self.async_set_updated_data(status)
+        return True
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        if self._store is None or self._save_scheduled:
+            return
+        self._save_scheduled = True
+        self._store.async_delay_save(self._async_snapshot_data, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _async_snapshot_data(self) -> dict[str, Any]:
+        self._save_scheduled = False
+        self._saved_source_version = self.client.source_index.version
+        return {
+            "status": asdict(self.data) if self.data is not None else None,
+            "source_map": dict(self.client.source_index.code_to_label),
+        }
+
+    @callback
+    def async_note_activity(self) -> None:
+        self._fast_scan_until = self.hass.loop.time() + FAST_SCAN_WINDOW
+        self.update_interval = self._next_update_interval(self.data)
+
+    @callback
+    def _async_publish(self, updates: dict[str, Any]) -> None:
+        if self.data is None:
+            return
+
+        data = replace(self.data, **updates)
+        self._last_successful_data = data
+        self.async_set_updated_data(data)
+
+    @callback
+    def _async_publish_changes(self, updates: dict[str, Any]) -> None:
+        if self.data is None:
+            return
+
+        changed = {
+            field: value
+            for field, value in updates.items()
+            if getattr(self.data, field) != value
+        }
+        if changed:
+            self._async_publish(changed)
+
+    @callback
+    def async_handle_pushed_status(self, updates: dict[str, Any]) -> None:
+        if self.data is None:
+            return
+
+        accepted: dict[str, Any] = {}
+        for field, value in updates.items():
+            pending = self._optimistic.get(field)
+            if pending is not None and pending[0] is not _UNKNOWN and pending[0] != value:
+                continue
+            self._optimistic.pop(field, None)
+            accepted[field] = value
+
+        if "power" in updates:
+            self.async_note_activity()
+
+        if accepted:
+            self._async_publish(accepted)
+
+        if "power" in updates:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def async_handle_disconnect(self) -> None:
+        self.update_interval = self._next_update_interval(self.data)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_apply_optimistic(self, updates: dict[str, Any]) -> None:
+        if self.data is None:
+            await self.async_request_refresh()
+            return
+
+        for field, value in updates.items():
+            previous = self._optimistic.get(field, (None, getattr(self.data, field)))[1]
+            self._optimistic[field] = (value, previous)
+        self.async_note_activity()
+        self._async_publish(updates)
+        self._async_schedule_confirm()
+
+    async def async_confirm_fields(self, fields: Iterable[str]) -> None:
+        if self.data is None:
+            await self.async_request_refresh()
+            return
+
+        for field in fields:
+            previous = self._optimistic.get(field, (None, getattr(self.data, field)))[1]
+            self._optimistic[field] = (_UNKNOWN, previous)
+        self.async_note_activity()
+        self._async_schedule_confirm()
+
+    @callback
+    def _async_schedule_confirm(self) -> None:
+        if self._unsub_confirm is not None:
+            self._unsub_confirm()
+        self._unsub_confirm = async_call_later(
+            self.hass,
+            OPTIMISTIC_CONFIRM_DELAY,
+            self._async_confirm_optimistic,
+        )
+
+    async def _async_confirm_optimistic(self, _now: datetime) -> None:
+        self._unsub_confirm = None
+        pending = self._optimistic
+        self._optimistic = {}
+        if not pending or self.data is None:
+            return
+
+        confirmed = await self._async_query_fields(pending)
+        updates = {
+            field: value for field, value in confirmed.items() if field not in self._optimistic
+        }
+        for field, (_, previous) in pending.items():
+            if field in self._optimistic:
+                continue
+            if field not in confirmed:
+                self.logger.debug("No AVR confirmation for %s; rolling back", field)
+                updates[field] = previous
+
+        self._async_publish_changes(updates)
+
+    async def async_refresh_fields(self, fields: Iterable[str]) -> None:
+        updates = await self._async_query_fields(fields)
+        for field in updates:
+            self._optimistic.pop(field, None)
+        self._async_publish_changes(updates)
+
+    async def _async_query_fields(self, fields: Iterable[str]) -> dict[str, Any]:
+        self._queued_fields.update(fields)
+        if self._field_fetch is None:
+            self._field_fetch = self.hass.async_create_task(self._async_fetch_queued_fields())
+        return await asyncio.shield(self._field_fetch)
+
+    async def _async_fetch_queued_fields(self) -> dict[str, Any]:
+        await asyncio.sleep(FIELD_REFRESH_COALESCE_DELAY)
+        fields = self._queued_fields
+        self._queued_fields = set()
+        self._field_fetch = None
+        return await self.client.async_get_fields(fields)
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_confirm is not None:
+            self._unsub_confirm()
+            self._unsub_confirm = None
+        if self._store is not None and self._save_scheduled:
+            await self._store.async_save(self._async_snapshot_data())
+        await super().async_shutdown()
@@ -1,27 +1,626 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any
+import math
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from functools import partial
+from typing import Any, TextIO, TypeVar
 
 from .const import (
+    CAPTURE_FORMAT,
+    CAPTURE_VERSION,
+    CONNECT_TIMEOUT,
+    DEFAULT_CONTINUOUS_WRITE_INTERVAL,
     DEFAULT_INPUT_SOURCES,
+    DEFAULT_MAX_RESPONSE_TIMEOUT,
+    DEFAULT_MIN_RESPONSE_TIMEOUT,
+    DEFAULT_RESPONSE_TIMEOUT,
     DIALOGUE_ENHANCER_OPTIONS,
     DIALOGUE_ENHANCER_QUERY_COMMAND,
+    DIALOGUE_ENHANCER_REFRESH_TIER,
     DIALOGUE_ENHANCER_RESPONSE_PREFIX,
     DYNAMIC_COMPRESSION_OPTIONS,
     DYNAMIC_COMPRESSION_QUERY_COMMAND,
+    DYNAMIC_COMPRESSION_REFRESH_TIER,
     DYNAMIC_COMPRESSION_RESPONSE_PREFIX,
     DYNAMIC_EQ_QUERY_COMMAND,
+    DYNAMIC_EQ_REFRESH_TIER,
     DYNAMIC_EQ_RESPONSE_PREFIX,
     DYNAMIC_VOLUME_QUERY_COMMAND,
+    DYNAMIC_VOLUME_REFRESH_TIER,
     DYNAMIC_VOLUME_RESPONSE_PREFIX,
+    FAMILY_MIN_RESPONSE_TIMEOUTS,
+    LATENCY_HISTOGRAM_BUCKETS,
     LOUDNESS_OPTIONS,
     LOUDNESS_QUERY_COMMAND,
+    LOUDNESS_REFRESH_TIER,
     LOUDNESS_RESPONSE_PREFIX,
+    MIN_COMMAND_INTERVAL,
+    PROTOCOL_TRACE_SIZE,
+    QUERY_FAILURE_THRESHOLD,
+    QUERY_MAX_REPROBE_INTERVAL,
+    QUERY_REPROBE_INTERVAL,
+    REFRESH_TIER_HOT,
+    REFRESH_TIER_PERIODS,
+    RELATED_QUERY_INVALIDATIONS,
+    RELATED_REFRESH_DELAY,
+    SOURCE_MAP_RESPONSE_TIMEOUT,
     STATUS_SENSOR_COMMANDS,
 )
 
+_T = TypeVar("_T")
+
+StatusQuery = tuple[str, str, str]
+
+STATUS_FIELD_QUERIES: dict[str, tuple[StatusQuery, ...]] = {
+    "power": (("PW?", "PW", REFRESH_TIER_HOT),),
+    "volume": (("MV?", "MV", REFRESH_TIER_HOT),),
+    "source": (("SI?", "SI", REFRESH_TIER_HOT),),
+    "muted": (("MU?", "MU", REFRESH_TIER_HOT),),
+    "sound_mode": (("MS?", "MS", REFRESH_TIER_HOT),),
+    "dynamic_eq": (
+        (DYNAMIC_EQ_QUERY_COMMAND, DYNAMIC_EQ_RESPONSE_PREFIX, DYNAMIC_EQ_REFRESH_TIER),
+    ),
+    "dynamic_volume": (
+        (
+            DYNAMIC_VOLUME_QUERY_COMMAND,
+            DYNAMIC_VOLUME_RESPONSE_PREFIX,
+            DYNAMIC_VOLUME_REFRESH_TIER,
+        ),
+    ),
+    "dialogue_enhancer": (
+        (
+            DIALOGUE_ENHANCER_QUERY_COMMAND,
+            DIALOGUE_ENHANCER_RESPONSE_PREFIX,
+            DIALOGUE_ENHANCER_REFRESH_TIER,
+        ),
+    ),
+    "dynamic_compression": (
+        (
+            DYNAMIC_COMPRESSION_QUERY_COMMAND,
+            DYNAMIC_COMPRESSION_RESPONSE_PREFIX,
+            DYNAMIC_COMPRESSION_REFRESH_TIER,
+        ),
+    ),
+    "loudness": ((LOUDNESS_QUERY_COMMAND, LOUDNESS_RESPONSE_PREFIX, LOUDNESS_REFRESH_TIER),),
+    **{
+        sensor_key: ((command, response_prefix, tier),)
+        for sensor_key, command, response_prefix, tier in STATUS_SENSOR_COMMANDS
+    },
+}
+
+BASE_STATUS_FIELDS: tuple[str, ...] = ("volume", "source", "muted", "sound_mode")
+EXTENDED_STATUS_FIELDS: tuple[str, ...] = (
+    "dynamic_eq",
+    "dynamic_volume",
+    "dialogue_enhancer",
+    "dynamic_compression",
+    "loudness",
+    *(sensor_key for sensor_key, *_ in STATUS_SENSOR_COMMANDS),
+)
+PROBED_STATUS_QUERIES: tuple[StatusQuery, ...] = tuple(
+    query for field in EXTENDED_STATUS_FIELDS for query in STATUS_FIELD_QUERIES[field]
+)
+PROBED_QUERY_COMMANDS: frozenset[str] = frozenset(
+    command for command, _, _ in PROBED_STATUS_QUERIES
+)
+QUERY_COMMAND_BY_PREFIX: dict[str, str] = {
+    response_prefix.upper(): command
+    for queries in STATUS_FIELD_QUERIES.values()
+    for command, response_prefix, _ in queries
+}
+MAX_FRAME_LENGTH = 4096
+OPTION_TOKEN_ALIASES: dict[str, tuple[str, ...]] = {
+    "off": ("OFF",),
+    "auto": ("AUTO",),
+    "low": ("LOW", "LIT", "LIGHT"),
+    "medium": ("MED", "MID", "MIDDLE"),
+    "high": ("HIGH", "HI", "HEV", "HEAVY"),
+}
+
+StatusListener = Callable[[dict[str, Any]], None]
+DisconnectListener = Callable[[], None]
+
+
+@dataclass(frozen=True, slots=True)
+class AvrStatus:
+    power: str = "OFF"
+    volume: float = 0.0
+    source: str | None = None
+    muted: bool = False
+    sound_mode: str | None = None
+    dynamic_eq: bool | None = None
+    dynamic_volume: str | None = None
+    dialogue_enhancer: str | None = None
+    dynamic_compression: str | None = None
+    loudness: str | None = None
+    cinema_eq_status: str | None = None
+    multi_eq_status: str | None = None
+
+    def diff(self, other: AvrStatus) -> frozenset[str]:
+        return frozenset(
+            name for name in self.__slots__ if getattr(self, name) != getattr(other, name)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SourceIndex:
+    version: int
+    options: tuple[str, ...]
+    code_to_label: Mapping[str, str]
+    label_to_code: Mapping[str, str]
+    canonical_labels: Mapping[str, str]
+    _option_keys: frozenset[str] = field(default=frozenset(), repr=False)
+    _option_lists: dict[str | None, list[str]] = field(
+        default_factory=dict,
+        compare=False,
+        repr=False,
+    )
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        discovered: Mapping[str, str],
+        filter_tokens: tuple[str, ...],
+    ) -> SourceIndex:
+        canonical_labels: dict[str, str] = {}
+        for label in (*DEFAULT_INPUT_SOURCES, *discovered.values()):
+            canonical_labels.setdefault(label.casefold(), label)
+
+        options = tuple(
+            label
+            for key, label in canonical_labels.items()
+            if not filter_tokens or any(token in key for token in filter_tokens)
+        )
+        return cls(
+            version=version,
+            options=options,
+            code_to_label=dict(discovered),
+            label_to_code={label.casefold(): code for code, label in discovered.items() if label},
+            canonical_labels=canonical_labels,
+            _option_keys=frozenset(option.casefold() for option in options),
+        )
+
+    def label_for_code(self, code: str | None) -> str | None:
+        if not code:
+            return None
+        return self.code_to_label.get(code.strip().upper(), code.strip())
+
+    def code_for_label(self, label: str) -> str:
+        return self.label_to_code.get(label.strip().casefold(), label)
+
+    def canonical_label(self, label: str | None) -> str | None:
+        if not label:
+            return None
+        return self.canonical_labels.get(label.strip().casefold(), label.strip())
+
+    def option_list(self, current: str | None = None) -> list[str]:
+        key = self.canonical_label(current)
+        if key is not None and key.casefold() in self._option_keys:
+            key = None
+        cached = self._option_lists.get(key)
+        if cached is None:
+            cached = [*self.options, key] if key else list(self.options)
+            if len(self._option_lists) >= 16:
+                self._option_lists.clear()
+            self._option_lists[key] = cached
+        return cached
+
+
+def _is_query(command: str) -> bool:
+    return command.rstrip().endswith("?")
+
+
+def _is_error_response(line: str) -> bool:
+    return line.strip().upper() == "E"
+
+
+def _decode_power(payload: str) -> str:
+    return "ON" if payload.upper().startswith("ON") else "OFF"
+
+
+def _decode_volume(payload: str) -> float:
+    try:
+        return max(0.0, min(1.0, int(payload[:2]) / 98.0))
+    except ValueError:
+        return 0.0
+
+
+def _decode_mute(payload: str) -> bool:
+    return payload.upper().endswith("ON")
+
+
+def _decode_text(payload: str) -> str | None:
+    return payload or None
+
+
+def _decode_sensor_text(payload: str) -> str | None:
+    return payload.lstrip(" :=") or None
+
+
+def _alias_decoder(aliases: Iterable[tuple[Any, tuple[str, ...]]]) -> Callable[[str], Any]:
+    ordered = tuple((token, value) for value, tokens in aliases for token in tokens)
+
+    def _scan(normalized: str) -> Any:
+        for token, value in ordered:
+            if token in normalized:
+                return value
+        return None
+
+    exact = {token: _scan(token) for token, _ in ordered}
+
+    def _decode(payload: str) -> Any:
+        if not payload:
+            return None
+        normalized = payload.upper()
+        if normalized in exact:
+            return exact[normalized]
+        return _scan(normalized)
+
+    return _decode
+
+
+def _option_decoder(options: Iterable[str]) -> Callable[[str], Any]:
+    return _alias_decoder(
+        (option, OPTION_TOKEN_ALIASES.get(option.casefold(), (option.upper(),)))
+        for option in options
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseField:
+    prefix: str
+    field: str | None
+    decode: Callable[[str], Any] = _decode_text
+    extended: bool = False
+
+
+class ResponseParserRegistry:
+    __slots__ = ("_by_family",)
+
+    def __init__(self, entries: Iterable[ResponseField]) -> None:
+        by_family: dict[str, list[ResponseField]] = {}
+        for entry in entries:
+            by_family.setdefault(entry.prefix[:2], []).append(entry)
+        self._by_family = {
+            family: tuple(sorted(items, key=lambda entry: len(entry.prefix), reverse=True))
+            for family, items in by_family.items()
+        }
+
+    def families(self, include_extended: bool) -> frozenset[str]:
+        return frozenset(
+            family
+            for family, entries in self._by_family.items()
+            if any(entry.field and (include_extended or not entry.extended) for entry in entries)
+        )
+
+    def parse(self, line: str) -> tuple[ResponseField, Any] | None:
+        upper = line.upper()
+        for entry in self._by_family.get(upper[:2], ()):
+            if upper.startswith(entry.prefix):
+                if entry.field is None:
+                    return None
+                return entry, entry.decode(line[len(entry.prefix) :].strip())
+        return None
+
+
+RESPONSE_PARSERS = ResponseParserRegistry(
+    (
+        ResponseField("PW", "power", _decode_power),
+        ResponseField("MVMAX", None),
+        ResponseField("MV", "volume", _decode_volume),
+        ResponseField("MU", "muted", _decode_mute),
+        ResponseField("SI", "source"),
+        ResponseField("MS", "sound_mode"),
+        ResponseField(
+            DYNAMIC_EQ_RESPONSE_PREFIX,
+            "dynamic_eq",
+            _alias_decoder(((True, ("ON",)), (False, ("OFF",)))),
+            extended=True,
+        ),
+        ResponseField(
+            DYNAMIC_VOLUME_RESPONSE_PREFIX,
+            "dynamic_volume",
+            _alias_decoder(
+                (
+                    ("Off", ("OFF",)),
+                    ("Light", ("LIT", "LIGHT")),
+                    ("Medium", ("MED", "MID", "MIDDLE")),
+                    ("Heavy", ("HEV", "HEAVY")),
+                )
+            ),
+            extended=True,
+        ),
+        ResponseField(
+            DIALOGUE_ENHANCER_RESPONSE_PREFIX,
+            "dialogue_enhancer",
+            _option_decoder(DIALOGUE_ENHANCER_OPTIONS),
+            extended=True,
+        ),
+        ResponseField(
+            DYNAMIC_COMPRESSION_RESPONSE_PREFIX,
+            "dynamic_compression",
+            _option_decoder(DYNAMIC_COMPRESSION_OPTIONS),
+            extended=True,
+        ),
+        ResponseField(
+            LOUDNESS_RESPONSE_PREFIX,
+            "loudness",
+            _option_decoder(LOUDNESS_OPTIONS),
+            extended=True,
+        ),
+        *(
+            ResponseField(response_prefix.upper(), sensor_key, _decode_sensor_text, extended=True)
+            for sensor_key, _, response_prefix, _ in STATUS_SENSOR_COMMANDS
+        ),
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CommandRequest:
+    command: str
+    timeout: float | None = None
+    expected_prefixes: tuple[str, ...] | None = None
+    allow_timeout: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class CommandResult:
+    command: str
+    response: str | None
+    latency: float | None
+    error: str | None = None
+
+
+class _PendingResponse:
+    __slots__ = (
+        "prefixes",
+        "future",
+        "multiline",
+        "lines",
+        "sent_at",
+        "answered_at",
+        "ambiguous",
+    )
+
+    def __init__(
+        self,
+        prefixes: tuple[str, ...],
+        future: asyncio.Future[str],
+        multiline: bool = False,
+    ) -> None:
+        self.prefixes = prefixes
+        self.future = future
+        self.multiline = multiline
+        self.lines: list[str] = []
+        self.sent_at = 0.0
+        self.answered_at = 0.0
+        self.ambiguous = False
+
+
+class _LineProtocol(asyncio.Protocol):
+    def __init__(
+        self,
+        on_frame: Callable[[bytes], None],
+        on_lost: Callable[[_LineProtocol, Exception | None], None],
+    ) -> None:
+        self._on_frame = on_frame
+        self._on_lost = on_lost
+        self._buffer = bytearray()
+        self._transport: asyncio.Transport | None = None
+        self._closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+        start = 0
+        while (end := buffer.find(b"\r", start)) != -1:
+            if end > start:
+                self._on_frame(bytes(buffer[start:end]))
+            start = end + 1
+        if start:
+            del buffer[:start]
+        if len(buffer) > MAX_FRAME_LENGTH:
+            buffer.clear()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if not self._closed.done():
+            self._closed.set_result(None)
+        self._can_write.set()
+        self._on_lost(self, exc)
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    def write(self, data: bytes) -> None:
+        if self._transport is None or self._transport.is_closing():
+            raise ConnectionError("AVR connection closed")
+        self._transport.write(data)
+
+    async def drain(self) -> None:
+        await self._can_write.wait()
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    async def wait_closed(self) -> None:
+        await asyncio.shield(self._closed)
+
+
+class _LatencyEstimate:
+    __slots__ = ("srtt", "rttvar", "backoff")
+
+    def __init__(self) -> None:
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.backoff = 1
+
+
+class _LatencyHistogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_HISTOGRAM_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, sample: float) -> None:
+        self.counts[bisect_left(LATENCY_HISTOGRAM_BUCKETS, sample)] += 1
+        self.total += sample
+        self.count += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"le_{int(bound * 1000)}ms" for bound in LATENCY_HISTOGRAM_BUCKETS]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else None,
+            "buckets": dict(zip([*labels, "inf"], self.counts, strict=True)),
+        }
+
+
+class _ProtocolMetrics:
+    __slots__ = (
+        "round_trips",
+        "timeouts",
+        "retries",
+        "connects",
+        "lock_wait",
+        "lock_wait_max",
+        "last_poll_duration",
+        "max_poll_duration",
+        "polls",
+        "discarded_lines",
+    )
+
+    def __init__(self) -> None:
+        self.round_trips: dict[str, _LatencyHistogram] = {}
+        self.timeouts: dict[str, int] = {}
+        self.retries = 0
+        self.connects = 0
+        self.lock_wait = 0.0
+        self.lock_wait_max = 0.0
+        self.last_poll_duration: float | None = None
+        self.max_poll_duration = 0.0
+        self.polls = 0
+        self.discarded_lines = 0
+
+    def observe_lock_wait(self, wait: float) -> None:
+        self.lock_wait += wait
+        self.lock_wait_max = max(self.lock_wait_max, wait)
+
+
+class _ProtocolTrace:
+    __slots__ = ("_times", "_sent", "_payloads", "_next", "_count")
+
+    def __init__(self, size: int) -> None:
+        self._times = [0.0] * size
+        self._sent = bytearray(size)
+        self._payloads: list[bytes] = [b""] * size
+        self._next = 0
+        self._count = 0
+
+    def record(self, sent: bool, payload: bytes, at: float) -> None:
+        index = self._next
+        self._times[index] = at
+        self._sent[index] = sent
+        self._payloads[index] = payload
+        self._next = (index + 1) % len(self._payloads)
+        if self._count < len(self._payloads):
+            self._count += 1
+
+    def as_list(self) -> list[dict[str, Any]]:
+        size = len(self._payloads)
+        start = (self._next - self._count) % size
+        return [
+            {
+                "t": round(self._times[index], 4),
+                "direction": "tx" if self._sent[index] else "rx",
+                "data": self._payloads[index].decode("ascii", errors="backslashreplace"),
+            }
+            for index in ((start + offset) % size for offset in range(self._count))
+        ]
+
+
+class _CaptureWriter:
+    __slots__ = ("path", "_queue", "_origin")
+
+    def __init__(
+        self,
+        capture: TextIO,
+        path: str,
+        origin: float,
+        header: dict[str, Any],
+    ) -> None:
+        self.path = path
+        self._origin = origin
+        self._queue: queue.SimpleQueue[tuple[str, bytes, float] | None] = queue.SimpleQueue()
+        threading.Thread(
+            target=self._write_records,
+            args=(capture, header),
+            name=f"denon_marantz capture {path}",
+            daemon=True,
+        ).start()
+
+    def record(self, kind: str, data: bytes, at: float) -> None:
+        self._queue.put((kind, data, at))
+
+    def close(self) -> None:
+        self._queue.put(None)
+
+    def _write_records(self, capture: TextIO, header: dict[str, Any]) -> None:
+        with capture:
+            capture.write(json.dumps(header) + "\n")
+            while (item := self._queue.get()) is not None:
+                kind, data, at = item
+                record = {"t": round(at - self._origin, 6), "kind": kind}
+                if data:
+                    record["data"] = data.decode("latin-1")
+                capture.write(json.dumps(record) + "\n")
+                if self._queue.empty():
+                    capture.flush()
+
+
+class _QueryHealth:
+    __slots__ = ("failures", "last_error", "unsupported", "reprobe_interval", "next_probe")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.last_error: str | None = None
+        self.unsupported = False
+        self.reprobe_interval = 0.0
+        self.next_probe = 0.0
+
 
 class DenonMarantzClient:
     def __init__(
@@ -30,87 +629,683 @@ class DenonMarantzClient:
         port: int,
         include_extended_entities: bool = False,
         input_filter: str = "",
+        continuous_write_interval: float = DEFAULT_CONTINUOUS_WRITE_INTERVAL,
+        capabilities: Iterable[str] | None = None,
+        min_response_timeout: float = DEFAULT_MIN_RESPONSE_TIMEOUT,
+        max_response_timeout: float = DEFAULT_MAX_RESPONSE_TIMEOUT,
     ) -> None:
         self.host = host
         self.port = port
         self._include_extended_entities = include_extended_entities
         self._input_filter_tokens = self._parse_input_filter(input_filter)
+        self._continuous_write_interval = continuous_write_interval
+        self._capabilities = frozenset(capabilities) if capabilities is not None else None
+        self._min_response_timeout = min_response_timeout
+        self._max_response_timeout = max(min_response_timeout, max_response_timeout)
+        self._latency: dict[str, _LatencyEstimate] = {}
+        self._metrics = _ProtocolMetrics()
+        self._trace = _ProtocolTrace(PROTOCOL_TRACE_SIZE)
+        self._capture: _CaptureWriter | None = None
         self.logger = logging.getLogger(__name__)
-        self._reader: asyncio.StreamReader | None = None
-        self._writer: asyncio.StreamWriter | None = None
-        self._lock = asyncio.Lock()
-        self._source_code_to_label: dict[str, str] = {}
-        self._source_label_to_code: dict[str, str] = {}
+        self._writer: _LineProtocol | None = None
+        self._pending: dict[str, _PendingResponse] = {}
+        self._pending_families: dict[str, dict[str, _PendingResponse]] = {}
+        self._outstanding: deque[tuple[_PendingResponse | None, float]] = deque()
+        self._push_families = RESPONSE_PARSERS.families(include_extended_entities)
+        self._prefix_locks: dict[str, asyncio.Lock] = {}
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._last_write = 0.0
+        self._coalesced_writes: dict[str, tuple[str, asyncio.Future[bool]]] = {}
+        self._coalesce_tasks: dict[str, asyncio.Task[None]] = {}
+        self._source_index = SourceIndex.build(0, {}, self._input_filter_tokens)
         self._source_map_fetched = False
+        self._status: AvrStatus | None = None
+        self._polled_fields: frozenset[str] = frozenset()
+        self._query_refreshed_at: dict[str, float] = {}
+        self._field_applied_at: dict[str, float] = {}
+        self._query_health: dict[str, _QueryHealth] = {}
+        self._stale_queries: set[str] = set()
+        self._related_refresh_task: asyncio.Task[None] | None = None
+        self._status_listeners: list[StatusListener] = []
+        self._disconnect_listeners: list[DisconnectListener] = []
+
+    @property
+    def source_index(self) -> SourceIndex:
+        return self._source_index
+
+    def restore(self, status: AvrStatus, source_map: Mapping[str, str]) -> None:
+        if source_map:
+            self._source_index = SourceIndex.build(
+                self._source_index.version + 1,
+                source_map,
+                self._input_filter_tokens,
+            )
+        if self._status is None:
+            self._status = status
 
-    async def connect(self) -> None:
+    @property
+    def polled_fields(self) -> frozenset[str]:
+        return self._polled_fields
+
+    @property
+    def push_connected(self) -> bool:
+        return self._writer is not None
+
+    def supports_query(self, command: str) -> bool:
+        if self._capabilities is None or command in self._capabilities:
+            return True
+        return command not in PROBED_QUERY_COMMANDS
+
+    def supports_field(self, field: str) -> bool:
+        return any(
+            self.supports_query(command) for command, _, _ in STATUS_FIELD_QUERIES.get(field, ())
+        )
+
+    def query_health(self) -> dict[str, dict[str, Any]]:
+        now = asyncio.get_running_loop().time()
+        return {
+            command: {
+                "failures": health.failures,
+                "last_error": health.last_error,
+                "unsupported": health.unsupported,
+                "next_probe_in": (
+                    max(0.0, round(health.next_probe - now, 1)) if health.unsupported else None
+                ),
+            }
+            for command, health in self._query_health.items()
+        }
+
+    def latency_estimates(self) -> dict[str, dict[str, Any]]:
+        return {
+            family: {
+                "srtt": round(estimate.srtt, 4) if estimate.srtt is not None else None,
+                "rttvar": round(estimate.rttvar, 4),
+                "backoff": estimate.backoff,
+                "timeout": round(self._response_timeout(family), 3),
+            }
+            for family, estimate in self._latency.items()
+        }
+
+    def metrics(self) -> dict[str, Any]:
+        metrics = self._metrics
+        histograms = metrics.round_trips.values()
+        round_trips = sum(histogram.count for histogram in histograms)
+        return {
+            "last_poll_duration": (
+                round(metrics.last_poll_duration, 4)
+                if metrics.last_poll_duration is not None
+                else None
+            ),
+            "max_poll_duration": round(metrics.max_poll_duration, 4),
+            "polls": metrics.polls,
+            "mean_round_trip": (
+                round(sum(histogram.total for histogram in histograms) / round_trips, 4)
+                if round_trips
+                else None
+            ),
+            "round_trips": {
+                family: histogram.as_dict() for family, histogram in metrics.round_trips.items()
+            },
+            "timeouts": sum(metrics.timeouts.values()),
+            "timeouts_by_family": dict(metrics.timeouts),
+            "retries": metrics.retries,
+            "reconnects": max(0, metrics.connects - 1),
+            "lock_wait": round(metrics.lock_wait, 4),
+            "lock_wait_max": round(metrics.lock_wait_max, 4),
+            "discarded_lines": metrics.discarded_lines,
+        }
+
+    def protocol_trace(self) -> list[dict[str, Any]]:
+        return self._trace.as_list()
+
+    @property
+    def capture_path(self) -> str | None:
+        return self._capture.path if self._capture is not None else None
+
+    async def async_start_capture(self, path: str) -> None:
+        loop = asyncio.get_running_loop()
+        capture = await loop.run_in_executor(None, partial(open, path, "a", encoding="ascii"))
+        self.stop_capture()
+        self._capture = _CaptureWriter(
+            capture,
+            path,
+            loop.time(),
+            {
+                "format": CAPTURE_FORMAT,
+                "version": CAPTURE_VERSION,
+                "host": self.host,
+                "port": self.port,
+                "started": time.time(),
+            },
+        )
         if self._writer is not None:
-            return
-        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            self._record_traffic("connect", b"")
+
+    def stop_capture(self) -> None:
+        if self._capture is not None:
+            self._capture.close()
+            self._capture = None
+
+    def _record_traffic(self, kind: str, data: bytes, at: float | None = None) -> None:
+        now = asyncio.get_running_loop().time() if at is None else at
+        if kind in ("tx", "rx"):
+            self._trace.record(kind == "tx", data, now)
+        if self._capture is not None:
+            self._capture.record(kind, data, now)
+
+    @staticmethod
+    def _latency_family(command: str) -> str:
+        return command.strip().upper()[:2]
+
+    def _response_timeout(self, family: str, default: float = DEFAULT_RESPONSE_TIMEOUT) -> float:
+        floor = max(self._min_response_timeout, FAMILY_MIN_RESPONSE_TIMEOUTS.get(family, 0.0))
+        estimate = self._latency.get(family)
+        if estimate is None:
+            return min(max(default, floor), self._max_response_timeout)
+
+        if estimate.srtt is None:
+            timeout = max(default, floor)
+        else:
+            timeout = max(estimate.srtt + 4 * estimate.rttvar, floor)
+        return min(timeout * estimate.backoff, self._max_response_timeout)
+
+    def _observe_latency(self, family: str, sample: float) -> None:
+        estimate = self._latency.setdefault(family, _LatencyEstimate())
+        if estimate.srtt is None:
+            estimate.srtt = sample
+            estimate.rttvar = sample / 2
+        else:
+            estimate.rttvar = 0.75 * estimate.rttvar + 0.25 * abs(estimate.srtt - sample)
+            estimate.srtt = 0.875 * estimate.srtt + 0.125 * sample
+        estimate.backoff = 1
+        self._metrics.round_trips.setdefault(family, _LatencyHistogram()).observe(sample)
+
+    def _note_response_timeout(self, family: str) -> None:
+        self._metrics.timeouts[family] = self._metrics.timeouts.get(family, 0) + 1
+        estimate = self._latency.setdefault(family, _LatencyEstimate())
+        if estimate.backoff < 64:
+            estimate.backoff *= 2
+
+    def add_status_listener(self, listener: StatusListener) -> Callable[[], None]:
+        self._status_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._status_listeners:
+                self._status_listeners.remove(listener)
+
+        return _remove
+
+    def add_disconnect_listener(self, listener: DisconnectListener) -> Callable[[], None]:
+        self._disconnect_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._disconnect_listeners:
+                self._disconnect_listeners.remove(listener)
+
+        return _remove
+
+    async def connect(self) -> None:
+        async with self._connect_lock:
+            if self._writer is not None:
+                return
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                _, writer = await asyncio.get_running_loop().create_connection(
+                    lambda: _LineProtocol(self._handle_frame, self._handle_connection_lost),
+                    self.host,
+                    self.port,
+                )
+            self._writer = writer
+            self._metrics.connects += 1
+            self._record_traffic("connect", b"")
 
     async def disconnect(self) -> None:
-        if self._writer is None:
-            return
-        self._writer.close()
-        await self._writer.wait_closed()
-        self._reader = None
-        self._writer = None
+        for task in [*self._coalesce_tasks.values(), *self._inflight.values()]:
+            task.cancel()
+        if self._related_refresh_task is not None:
+            self._related_refresh_task.cancel()
 
-    async def _async_reset_connection(self) -> None:
         writer = self._writer
-        self._reader = None
-        self._writer = None
         if writer is None:
+            self.stop_capture()
+            return
+        self._detach_connection(writer)
+        self.stop_capture()
+        writer.close()
+        await writer.wait_closed()
+
+    async def _async_reset_connection(self, writer: _LineProtocol | None) -> None:
+        if writer is None or writer is not self._writer:
             return
+        self._detach_connection(writer)
         writer.close()
         try:
             await writer.wait_closed()
         except Exception:
             return
 
+    def _detach_connection(self, writer: _LineProtocol) -> None:
+        if writer is not self._writer:
+            return
+
+        self._writer = None
+        self._outstanding.clear()
+        self._record_traffic("disconnect", b"")
+
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.set_exception(ConnectionError("AVR connection lost"))
+
+    async def _async_connected_writer(self) -> _LineProtocol:
+        await self.connect()
+        writer = self._writer
+        if writer is None:
+            raise ConnectionError("AVR connection closed")
+        return writer
+
+    def _handle_connection_lost(self, writer: _LineProtocol, exc: Exception | None) -> None:
+        if writer is not self._writer:
+            return
+
+        self.logger.debug("AVR connection lost: %s", exc)
+        self._detach_connection(writer)
+        for listener in list(self._disconnect_listeners):
+            listener()
+
+    def _handle_frame(self, frame: bytes) -> None:
+        self._record_traffic("rx", frame)
+        frame = frame.lstrip()
+        if not frame:
+            return
+        family = frame[:2].decode("ascii", errors="ignore").upper()
+        if (
+            family not in self._push_families
+            and family not in self._pending_families
+            and not (self._pending and family[:1] in self._pending_families)
+            and not (self._outstanding and frame.strip().upper() == b"E")
+        ):
+            self._metrics.discarded_lines += 1
+            return
+
+        decoded = frame.decode("ascii", errors="ignore").strip()
+        if decoded:
+            self._handle_line(decoded)
+
+    def _handle_line(self, decoded: str) -> None:
+        upper = decoded.upper()
+        pending = self._match_pending(upper)
+        if pending is None:
+            self._apply_unsolicited_line(decoded)
+            return
+
+        if not pending.multiline or _is_error_response(upper):
+            pending.answered_at = asyncio.get_running_loop().time()
+            pending.future.set_result(decoded)
+            return
+
+        for prefix in pending.prefixes:
+            if upper.startswith(prefix) and upper[len(prefix) :].strip() == "END":
+                pending.answered_at = asyncio.get_running_loop().time()
+                pending.future.set_result(decoded)
+                return
+        pending.lines.append(decoded)
+
+    def _match_pending(self, upper: str) -> _PendingResponse | None:
+        if _is_error_response(upper):
+            return self._error_recipient()
+
+        matched: _PendingResponse | None = None
+        matched_length = 0
+        for family in (upper[:2], upper[:1]):
+            for prefix, pending in self._pending_families.get(family, {}).items():
+                if (
+                    len(prefix) > matched_length
+                    and upper.startswith(prefix)
+                    and not pending.future.done()
+                ):
+                    matched = pending
+                    matched_length = len(prefix)
+
+        return matched
+
+    def _error_recipient(self) -> _PendingResponse | None:
+        now = asyncio.get_running_loop().time()
+        live = [entry for entry in self._outstanding if self._is_outstanding(entry, now)]
+        if not live:
+            self._outstanding.clear()
+            return None
+
+        (pending, _), *later = live
+        self._outstanding = deque(later)
+        if pending is not None:
+            pending.ambiguous = bool(later)
+        return pending
+
+    @staticmethod
+    def _is_outstanding(entry: tuple[_PendingResponse | None, float], now: float) -> bool:
+        pending, expires_at = entry
+        if pending is None:
+            return now < expires_at
+        return not pending.future.done()
+
+    def _track_outstanding(
+        self,
+        commands: Sequence[str],
+        pending: Sequence[_PendingResponse | None],
+        now: float,
+    ) -> None:
+        outstanding = self._outstanding
+        while outstanding and not self._is_outstanding(outstanding[0], now):
+            outstanding.popleft()
+        for command, entry in zip(commands, pending, strict=True):
+            if entry is None:
+                family = self._latency_family(command)
+                outstanding.append((None, now + self._response_timeout(family)))
+            else:
+                outstanding.append((entry, math.inf))
+
+    def _apply_unsolicited_line(self, decoded: str) -> None:
+        if not self._apply_response_line(decoded):
+            self._metrics.discarded_lines += 1
+            self.logger.debug("Ignoring unsolicited AVR line: %s", decoded)
+
+    def _apply_response_line(self, line: str) -> bool:
+        parsed = self._parse_response(line)
+        if self._status is None or parsed is None:
+            return False
+
+        entry, value = parsed
+        now = asyncio.get_running_loop().time()
+        command = QUERY_COMMAND_BY_PREFIX.get(entry.prefix)
+        if command is not None:
+            self._query_refreshed_at[command] = now
+        self._field_applied_at[entry.field] = now
+
+        if self._apply_status_updates({entry.field: value}):
+            self._invalidate_related_queries(entry.prefix[:2])
+        return True
+
+    def _apply_status_updates(self, updates: dict[str, Any]) -> bool:
+        status = self._status
+        if status is None:
+            return False
+
+        changed = {
+            field: value for field, value in updates.items() if getattr(status, field) != value
+        }
+        if not changed:
+            return False
+
+        self._status = replace(status, **changed)
+        for listener in list(self._status_listeners):
+            listener(changed)
+        return True
+
+    def _invalidate_related_queries(self, family: str) -> None:
+        related = RELATED_QUERY_INVALIDATIONS.get(family)
+        if not related or not self._include_extended_entities:
+            return
+
+        for command in related:
+            self._query_refreshed_at.pop(command, None)
+        self._stale_queries.update(related)
+        if self._related_refresh_task is None or self._related_refresh_task.done():
+            self._related_refresh_task = asyncio.get_running_loop().create_task(
+                self._async_refresh_related_queries(),
+                name=f"denon_marantz related refresh {self.host}",
+            )
+
+    async def _async_refresh_related_queries(self) -> None:
+        while self._stale_queries:
+            await asyncio.sleep(RELATED_REFRESH_DELAY)
+            stale = self._stale_queries
+            self._stale_queries = set()
+            if self._status is None or self._status.power != "ON":
+                continue
+
+            queries = [
+                query
+                for field_queries in STATUS_FIELD_QUERIES.values()
+                for query in field_queries
+                if query[0] in stale
+            ]
+            self._apply_status_updates(await self._async_read_queries(queries))
+
+    @asynccontextmanager
+    async def _async_reserve_prefixes(self, prefixes: Iterable[str]) -> AsyncIterator[None]:
+        acquired: list[asyncio.Lock] = []
+        loop = asyncio.get_running_loop()
+        try:
+            started = loop.time()
+            for prefix in sorted(set(prefixes)):
+                lock = self._prefix_locks.setdefault(prefix, asyncio.Lock())
+                await lock.acquire()
+                acquired.append(lock)
+            self._metrics.observe_lock_wait(loop.time() - started)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+    def _register_pending(
+        self,
+        prefixes: tuple[str, ...],
+        multiline: bool = False,
+    ) -> _PendingResponse:
+        pending = _PendingResponse(
+            prefixes,
+            asyncio.get_running_loop().create_future(),
+            multiline=multiline,
+        )
+        for prefix in prefixes:
+            self._pending[prefix] = pending
+            self._pending_families.setdefault(prefix[:2], {})[prefix] = pending
+        return pending
+
+    def _unregister_pending(self, pending: _PendingResponse) -> None:
+        if pending.future.done() and not pending.future.cancelled():
+            pending.future.exception()
+        for prefix in pending.prefixes:
+            if self._pending.get(prefix) is pending:
+                del self._pending[prefix]
+            family = self._pending_families.get(prefix[:2])
+            if family is not None and family.get(prefix) is pending:
+                del family[prefix]
+                if not family:
+                    del self._pending_families[prefix[:2]]
+
+    async def _async_write(
+        self,
+        writer: _LineProtocol,
+        commands: Sequence[str],
+        pending: Sequence[_PendingResponse | None] = (),
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        pending = pending or [None] * len(commands)
+        async with self._write_lock:
+            self._metrics.observe_lock_wait(loop.time() - started)
+            for group in self._write_groups(commands):
+                delay = self._last_write + MIN_COMMAND_INTERVAL - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lines = [f"{command}\r".encode("ascii") for command in commands[group]]
+                writer.write(b"".join(lines))
+                sent_at = loop.time()
+                for line in lines:
+                    self._record_traffic("tx", line, sent_at)
+                for entry in pending[group]:
+                    if entry is not None:
+                        entry.sent_at = sent_at
+                if writer is self._writer:
+                    self._track_outstanding(commands[group], pending[group], sent_at)
+                await writer.drain()
+                self._last_write = loop.time()
+
+    @staticmethod
+    def _write_groups(commands: Sequence[str]) -> Iterator[slice]:
+        start = 0
+        for index in range(1, len(commands) + 1):
+            if (
+                index == len(commands)
+                or not _is_query(commands[index - 1])
+                or not _is_query(commands[index])
+            ):
+                yield slice(start, index)
+                start = index
+
     async def _async_send(
         self,
         command: str,
-        timeout: float = 2.0,
+        timeout: float | None = None,
         expected_prefixes: tuple[str, ...] | None = None,
         allow_timeout: bool = False,
     ) -> str:
-        async with self._lock:
-            expected = tuple(
-                prefix.upper() for prefix in (expected_prefixes or self._expected_prefixes(command))
+        expected = self._normalize_expected_prefixes(command, expected_prefixes)
+        if _is_query(command):
+            return await self._async_singleflight(
+                ("query", command.strip().upper(), expected, allow_timeout, timeout),
+                partial(self._async_send_reserved, command, timeout, expected, allow_timeout),
+            )
+        return await self._async_send_reserved(command, timeout, expected, allow_timeout)
+
+    async def _async_send_reserved(
+        self,
+        command: str,
+        timeout: float | None,
+        expected: tuple[str, ...],
+        allow_timeout: bool,
+    ) -> str:
+        async with self._async_reserve_prefixes(expected):
+            return await self._async_run_with_retry(
+                command,
+                lambda writer: self._async_send_once(
+                    writer,
+                    command,
+                    timeout,
+                    expected,
+                    allow_timeout=allow_timeout,
+                ),
             )
 
-            last_error: Exception | None = None
-            for attempt in (1, 2):
+    async def _async_singleflight(
+        self,
+        key: Hashable,
+        factory: Callable[[], Coroutine[Any, Any, _T]],
+    ) -> _T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(factory())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._finish_inflight, key))
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_send_nowait(self, command: str) -> None:
+        await self._async_run_with_retry(
+            command,
+            lambda writer: self._async_write(writer, (command,)),
+        )
+
+    async def _async_send_coalesced(self, key: str, command: str) -> bool:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+
+        superseded = self._coalesced_writes.get(key)
+        if superseded is not None and not superseded[1].done():
+            superseded[1].set_result(False)
+        self._coalesced_writes[key] = (command, future)
+
+        if key not in self._coalesce_tasks:
+            self._coalesce_tasks[key] = loop.create_task(self._async_flush_coalesced(key))
+
+        return await future
+
+    async def _async_flush_coalesced(self, key: str) -> None:
+        try:
+            while (queued := self._coalesced_writes.pop(key, None)) is not None:
+                command, future = queued
                 try:
-                    await self.connect()
-                    return await self._async_send_once(
-                        command,
-                        timeout,
-                        expected,
-                        allow_timeout=allow_timeout,
+                    await self._async_send_nowait(command)
+                except Exception as err:
+                    if not future.done():
+                        future.set_exception(err)
+                else:
+                    if not future.done():
+                        future.set_result(True)
+                await asyncio.sleep(self._continuous_write_interval)
+        finally:
+            self._coalesce_tasks.pop(key, None)
+            queued = self._coalesced_writes.pop(key, None)
+            if queued is not None:
+                queued[1].cancel()
+
+    async def _async_query_batch(
+        self,
+        queries: list[tuple[str, tuple[str, ...] | None]],
+        timeout: float | None = None,
+    ) -> list[str | None]:
+        if not queries:
+            return []
+
+        expected = [
+            self._normalize_expected_prefixes(command, expected_prefixes)
+            for command, expected_prefixes in queries
+        ]
+        async with self._async_reserve_prefixes(
+            prefix for prefixes in expected for prefix in prefixes
+        ):
+            return await self._async_run_with_retry(
+                ", ".join(command for command, _ in queries),
+                lambda writer: self._async_query_batch_once(
+                    writer,
+                    [command for command, _ in queries],
+                    expected,
+                    timeout,
+                ),
+            )
+
+    async def _async_run_with_retry(
+        self,
+        description: str,
+        operation: Callable[[_LineProtocol], Awaitable[_T]],
+    ) -> _T:
+        last_error: Exception | None = None
+        for attempt in (1, 2):
+            writer: _LineProtocol | None = None
+            try:
+                writer = await self._async_connected_writer()
+                return await operation(writer)
+            except TimeoutError:
+                raise
+            except (ConnectionError, OSError, asyncio.IncompleteReadError) as err:
+                last_error = err
+                await self._async_reset_connection(writer)
+                if attempt == 1:
+                    self._metrics.retries += 1
+                    self.logger.debug(
+                        "Transient AVR connection error on %s; retrying once: %s",
+                        description,
+                        err,
                     )
-                except (ConnectionError, OSError, asyncio.IncompleteReadError) as err:
-                    last_error = err
-                    await self._async_reset_connection()
-                    if attempt == 1:
-                        self.logger.debug(
-                            "Transient AVR connection error on %s; retrying once: %s",
-                            command,
-                            err,
-                        )
-                        continue
-                    raise
-
-            if last_error is not None:
-                raise last_error
-
-            raise RuntimeError("Unexpected protocol send state")
+                    continue
+                raise
+
+        if last_error is not None:
+            raise last_error
+
+        raise RuntimeError("Unexpected protocol send state")
 
     async def async_send_command(
         self,
         command: str,
-        timeout: float = 2.0,
+        timeout: float | None = None,
         expected_prefixes: tuple[str, ...] | None = None,
         allow_timeout: bool = False,
     ) -> str:
@@ -118,41 +1313,116 @@ class DenonMarantzClient:
         if expected_prefixes:
             normalized_prefixes = tuple(prefix.strip() for prefix in expected_prefixes if prefix.strip())
 
-        return await self._async_send(
+        response = await self._async_send(
             command=command,
             timeout=timeout,
             expected_prefixes=normalized_prefixes,
             allow_timeout=allow_timeout,
         )
+        self._apply_response_line(response)
+        return response
+
+    async def async_send_commands(
+        self,
+        requests: Sequence[CommandRequest],
+    ) -> list[CommandResult]:
+        batch = [
+            (request, self._normalize_expected_prefixes(request.command, request.expected_prefixes))
+            for request in requests
+        ]
+        waves: list[list[tuple[CommandRequest, tuple[str, ...]]]] = []
+        claimed: set[str] = set()
+        for item in batch:
+            if not waves or claimed.intersection(item[1]):
+                waves.append([])
+                claimed = set()
+            waves[-1].append(item)
+            claimed.update(item[1])
+
+        results: list[CommandResult] = []
+        async with self._async_reserve_prefixes(
+            prefix for _, prefixes in batch for prefix in prefixes
+        ):
+            for wave in waves:
+                results.extend(
+                    await self._async_run_with_retry(
+                        ", ".join(request.command for request, _ in wave),
+                        partial(self._async_send_wave_once, wave=wave),
+                    )
+                )
+
+        for result in results:
+            if result.response:
+                self._apply_response_line(result.response)
+        return results
+
+    async def _async_send_wave_once(
+        self,
+        writer: _LineProtocol,
+        wave: list[tuple[CommandRequest, tuple[str, ...]]],
+    ) -> list[CommandResult]:
+        families = [self._latency_family(request.command) for request, _ in wave]
+        timeouts = [
+            request.timeout if request.timeout is not None else self._response_timeout(family)
+            for (request, _), family in zip(wave, families, strict=True)
+        ]
+        batch = [self._register_pending(prefixes) for _, prefixes in wave]
+
+        async def _async_wait(pending: _PendingResponse, timeout: float) -> None:
+            try:
+                await asyncio.wait_for(asyncio.shield(pending.future), timeout=timeout)
+            except TimeoutError:
+                pending.future.cancel()
+
+        try:
+            await self._async_write(writer, [request.command for request, _ in wave], batch)
+            await asyncio.gather(
+                *(
+                    _async_wait(pending, timeout)
+                    for pending, timeout in zip(batch, timeouts, strict=True)
+                )
+            )
+        finally:
+            for pending in batch:
+                pending.future.cancel()
+                self._unregister_pending(pending)
+
+        results: list[CommandResult] = []
+        for (request, _), family, pending in zip(wave, families, batch, strict=True):
+            if pending.future.cancelled():
+                if request.allow_timeout:
+                    results.append(CommandResult(request.command, "", None))
+                else:
+                    self._note_response_timeout(family)
+                    results.append(CommandResult(request.command, None, None, "timeout"))
+                continue
+
+            error = pending.future.exception()
+            if error is not None:
+                raise error
+            latency = pending.answered_at - pending.sent_at
+            self._observe_latency(family, latency)
+            results.append(CommandResult(request.command, pending.future.result(), latency))
+
+        return results
 
     async def _async_send_once(
         self,
+        writer: _LineProtocol,
         command: str,
-        timeout: float,
+        timeout: float | None,
         expected: tuple[str, ...],
         allow_timeout: bool,
     ) -> str:
-        assert self._writer is not None
-        assert self._reader is not None
-
-        loop = asyncio.get_running_loop()
-        deadline = loop.time() + timeout
-
-        self._writer.write(f"{command}\r".encode("ascii"))
-        await self._writer.drain()
-        while True:
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                if allow_timeout:
-                    self.logger.debug(
-                        "No immediate AVR response for %s; continuing without acknowledgement",
-                        command,
-                    )
-                    return ""
-                raise TimeoutError(f"Timeout waiting for response to '{command}'")
+        family = self._latency_family(command)
+        if timeout is None:
+            timeout = self._response_timeout(family)
 
+        pending = self._register_pending(expected)
+        try:
+            await self._async_write(writer, (command,), (pending,))
             try:
-                response = await asyncio.wait_for(self._reader.readuntil(b"\r"), timeout=remaining)
+                response = await asyncio.wait_for(pending.future, timeout=timeout)
             except TimeoutError:
                 if allow_timeout:
                     self.logger.debug(
@@ -160,22 +1430,66 @@ class DenonMarantzClient:
                         command,
                     )
                     return ""
-                raise TimeoutError(f"Timeout waiting for response to '{command}'")
+                self._note_response_timeout(family)
+                raise TimeoutError(f"Timeout waiting for response to '{command}'") from None
+        finally:
+            self._unregister_pending(pending)
 
-            decoded = response.decode("ascii", errors="ignore").strip()
-            upper = decoded.upper()
+        self._observe_latency(family, pending.answered_at - pending.sent_at)
+        return response
 
-            if upper.startswith("E"):
-                return decoded
+    async def _async_query_batch_once(
+        self,
+        writer: _LineProtocol,
+        commands: list[str],
+        expected: list[tuple[str, ...]],
+        timeout: float | None,
+    ) -> list[str | None]:
+        families = [self._latency_family(command) for command in commands]
+        if timeout is None:
+            timeout = max(self._response_timeout(family) for family in families)
+
+        batch = [self._register_pending(prefixes) for prefixes in expected]
+        try:
+            await self._async_write(writer, commands, batch)
+            await asyncio.wait([pending.future for pending in batch], timeout=timeout)
+        finally:
+            # Cancelled futures drop out of the E attribution FIFO, even when
+            # the caller itself was cancelled mid-wait.
+            for pending in batch:
+                pending.future.cancel()
+                self._unregister_pending(pending)
+
+        for family, pending in zip(families, batch, strict=True):
+            if pending.future.cancelled():
+                self._note_response_timeout(family)
+        for family, pending in zip(families, batch, strict=True):
+            if pending.answered_at and not pending.ambiguous:
+                self._observe_latency(family, pending.answered_at - pending.sent_at)
+
+        results: list[str | None] = []
+        for command, pending in zip(commands, batch, strict=True):
+            if pending.future.cancelled():
+                self.logger.debug("No AVR response for pipelined query %s", command)
+                results.append(None)
+                continue
 
-            if any(upper.startswith(prefix) for prefix in expected):
-                return decoded
+            error = pending.future.exception()
+            if error is not None:
+                raise error
+            results.append("" if pending.ambiguous else pending.future.result())
 
-            self.logger.debug(
-                "Discarding unsolicited AVR line while waiting for %s: %s",
-                command,
-                decoded,
-            )
+        return results
+
+    @classmethod
+    def _normalize_expected_prefixes(
+        cls,
+        command: str,
+        expected_prefixes: tuple[str, ...] | None,
+    ) -> tuple[str, ...]:
+        return tuple(
+            prefix.upper() for prefix in (expected_prefixes or cls._expected_prefixes(command))
+        )
 
     @staticmethod
     def _expected_prefixes(command: str) -> tuple[str, ...]:
@@ -194,129 +1508,205 @@ class DenonMarantzClient:
         if cmd.startswith("MS"):
             return ("MS",)
 
+        head = cmd.split(" ", 1)[0]
+        if len(head) > 2 and " " in cmd:
+            return (head,)
         return (cmd[:2],)
 
-    async def async_get_status(self) -> dict[str, Any]:
+    async def async_get_status(self) -> AvrStatus:
+        return await self._async_singleflight("status", self._async_read_status)
+
+    async def _async_read_status(self) -> AvrStatus:
+        started = asyncio.get_running_loop().time()
+        status = await self._async_read_status_once()
+        duration = asyncio.get_running_loop().time() - started
+        self._metrics.last_poll_duration = duration
+        self._metrics.max_poll_duration = max(self._metrics.max_poll_duration, duration)
+        self._metrics.polls += 1
+        return status
+
+    async def _async_read_status_once(self) -> AvrStatus:
+        if self._status is None:
+            # Pushes that land while the first poll is still running are
+            # applied to this placeholder so the poll keeps them.
+            self._status = AvrStatus()
         await self._async_ensure_source_map()
 
-        power_raw = await self._async_send("PW?")
-        power = self._parse_power(power_raw)
-
-        if power != "ON":
-            return {
-                "power": power,
-                "volume": 0.0,
-                "source": None,
-                "muted": False,
-                "sound_mode": None,
-                "dynamic_eq": None,
-                "dynamic_volume": None,
-                "dialogue_enhancer": None,
-                "dynamic_compression": None,
-                "loudness": None,
-                "status_sensors": self._empty_status_sensors(),
-            }
+        try:
+            power_raw = await self._async_send("PW?")
+        except TimeoutError:
+            # A socket that stays open but stops answering never raises a
+            # connection error, so drop it and let the next poll reconnect.
+            await self._async_reset_connection(self._writer)
+            raise
+        power = self._status_updates_from_line(power_raw).get("power", "OFF")
+
+        if power == "ON":
+            fields = BASE_STATUS_FIELDS
+            if self._include_extended_entities:
+                fields += EXTENDED_STATUS_FIELDS
+            updates = await self._async_read_fields(fields, due_only=True)
+            previous = self._status
+            if previous is None or previous.power != "ON":
+                previous = AvrStatus(power=power)
+            status = replace(previous, **updates)
+            self._polled_fields = frozenset({"power", *updates})
+        else:
+            self._query_refreshed_at.clear()
+            status = AvrStatus(power=power)
+            self._polled_fields = frozenset(AvrStatus.__slots__)
 
-        volume_raw = await self._async_query_optional("MV?")
-        source_raw = await self._async_query_optional("SI?")
-        mute_raw = await self._async_query_optional("MU?")
-        sound_mode_raw = await self._async_query_optional("MS?")
-
-        dynamic_eq_raw: str | None = None
-        dynamic_volume_raw: str | None = None
-        dialogue_enhancer_raw: str | None = None
-        dynamic_compression_raw: str | None = None
-        loudness_raw: str | None = None
-        if self._include_extended_entities:
-            dynamic_eq_raw = await self._async_query_optional(
-                DYNAMIC_EQ_QUERY_COMMAND,
-                expected_prefixes=(DYNAMIC_EQ_RESPONSE_PREFIX,),
-            )
-            dynamic_volume_raw = await self._async_query_optional(
-                DYNAMIC_VOLUME_QUERY_COMMAND,
-                expected_prefixes=(DYNAMIC_VOLUME_RESPONSE_PREFIX,),
-            )
-            dialogue_enhancer_raw = await self._async_query_optional(
-                DIALOGUE_ENHANCER_QUERY_COMMAND,
-                expected_prefixes=(DIALOGUE_ENHANCER_RESPONSE_PREFIX,),
-            )
-            dynamic_compression_raw = await self._async_query_optional(
-                DYNAMIC_COMPRESSION_QUERY_COMMAND,
-                expected_prefixes=(DYNAMIC_COMPRESSION_RESPONSE_PREFIX,),
+        self._status = status
+        return status
+
+    async def async_get_fields(self, fields: Iterable[str]) -> dict[str, Any]:
+        updates = await self._async_read_fields(fields)
+        if self._status is not None:
+            self._status = replace(self._status, **updates)
+        return updates
+
+    async def _async_read_fields(
+        self,
+        fields: Iterable[str],
+        due_only: bool = False,
+    ) -> dict[str, Any]:
+        now = asyncio.get_running_loop().time()
+        queries = [
+            query
+            for field in dict.fromkeys(fields)
+            for query in STATUS_FIELD_QUERIES.get(field, ())
+            if not due_only or self._query_due(query, now)
+        ]
+        return await self._async_read_queries(queries)
+
+    def _query_due(self, query: StatusQuery, now: float) -> bool:
+        command, _, tier = query
+        refreshed_at = self._query_refreshed_at.get(command)
+        return refreshed_at is None or now - refreshed_at >= REFRESH_TIER_PERIODS[tier]
+
+    async def _async_read_queries(
+        self,
+        queries: list[StatusQuery],
+    ) -> dict[str, Any]:
+        now = asyncio.get_running_loop().time()
+        queries = [
+            query
+            for query in queries
+            if self.supports_query(query[0]) and self._query_available(query[0], now)
+        ]
+        if not queries:
+            return {}
+
+        requested_at = now
+        try:
+            responses = await self._async_query_batch(
+                [(command, (response_prefix,)) for command, response_prefix, _ in queries]
             )
-            loudness_raw = await self._async_query_optional(
-                LOUDNESS_QUERY_COMMAND,
-                expected_prefixes=(LOUDNESS_RESPONSE_PREFIX,),
+            if "" in responses:
+                for index, (command, response_prefix, _) in enumerate(queries):
+                    if not responses[index]:
+                        responses[index] = (
+                            await self._async_query_batch([(command, (response_prefix,))])
+                        )[0]
+        except Exception as err:
+            self.logger.debug("Optional AVR status queries failed: %s", err)
+            return {}
+
+        now = asyncio.get_running_loop().time()
+        link_alive = any(raw is not None for raw in responses)
+        updates: dict[str, Any] = {}
+        for (command, _, _), raw in zip(queries, responses, strict=True):
+            if raw is None:
+                if link_alive:
+                    self._record_query_failure(command, "timeout", now)
+                continue
+            if not raw:
+                continue
+            if _is_error_response(raw):
+                self._record_query_failure(command, raw, now)
+                continue
+            self._query_health.pop(command, None)
+            self._query_refreshed_at[command] = now
+            updates.update(self._status_updates_from_line(raw))
+
+        if self._status is not None:
+            for field in updates:
+                if self._field_applied_at.get(field, 0.0) > requested_at:
+                    updates[field] = getattr(self._status, field)
+        return updates
+
+    def _query_available(self, command: str, now: float) -> bool:
+        if command not in PROBED_QUERY_COMMANDS:
+            return True
+        health = self._query_health.get(command)
+        return health is None or not health.unsupported or now >= health.next_probe
+
+    def _record_query_failure(self, command: str, error: str, now: float) -> None:
+        # Base queries back every entity; a few dropped replies must never
+        # take them out of the poll.
+        if command not in PROBED_QUERY_COMMANDS:
+            return
+        health = self._query_health.setdefault(command, _QueryHealth())
+        health.failures += 1
+        health.last_error = error
+        if health.failures < QUERY_FAILURE_THRESHOLD:
+            return
+
+        if health.unsupported:
+            health.reprobe_interval = min(health.reprobe_interval * 2, QUERY_MAX_REPROBE_INTERVAL)
+        else:
+            health.unsupported = True
+            health.reprobe_interval = QUERY_REPROBE_INTERVAL
+            self.logger.info(
+                "AVR did not answer %s %s times; treating it as unsupported",
+                command,
+                health.failures,
             )
-        status_sensors = (
-            await self._async_get_status_sensors()
-            if self._include_extended_entities
-            else self._empty_status_sensors()
-        )
+        health.next_probe = now + health.reprobe_interval
 
-        source_code = self._strip_prefix(source_raw, "SI")
-        source_label = self._source_label_from_code(source_code)
+    async def async_probe_capabilities(self) -> list[str] | None:
+        power_raw = await self._async_send("PW?", timeout=DEFAULT_RESPONSE_TIMEOUT)
+        if self._status_updates_from_line(power_raw).get("power") != "ON":
+            return None
 
-        return {
-            "power": power,
-            "volume": self._parse_volume(volume_raw or ""),
-            "source": source_label,
-            "source_options": self._source_options(source_label),
-            "muted": bool(mute_raw and mute_raw.upper().endswith("ON")),
-            "sound_mode": self._strip_prefix(sound_mode_raw, "MS"),
-            "dynamic_eq": (
-                self._parse_on_off_status(self._strip_prefix(dynamic_eq_raw, DYNAMIC_EQ_RESPONSE_PREFIX))
-                if self._include_extended_entities
-                else None
-            ),
-            "dynamic_volume": (
-                self._parse_dynamic_volume_status(
-                    self._strip_prefix(dynamic_volume_raw, DYNAMIC_VOLUME_RESPONSE_PREFIX)
-                )
-                if self._include_extended_entities
-                else None
-            ),
-            "dialogue_enhancer": (
-                self._parse_option_status(
-                    self._strip_prefix(dialogue_enhancer_raw, DIALOGUE_ENHANCER_RESPONSE_PREFIX),
-                    DIALOGUE_ENHANCER_OPTIONS,
-                )
-                if self._include_extended_entities
-                else None
-            ),
-            "dynamic_compression": (
-                self._parse_option_status(
-                    self._strip_prefix(dynamic_compression_raw, DYNAMIC_COMPRESSION_RESPONSE_PREFIX),
-                    DYNAMIC_COMPRESSION_OPTIONS,
-                )
-                if self._include_extended_entities
-                else None
-            ),
-            "loudness": (
-                self._parse_option_status(
-                    self._strip_prefix(loudness_raw, LOUDNESS_RESPONSE_PREFIX),
-                    LOUDNESS_OPTIONS,
+        supported: list[str] = []
+        for command, response_prefix, _ in PROBED_STATUS_QUERIES:
+            for _attempt in (1, 2):
+                (raw,) = await self._async_query_batch(
+                    [(command, (response_prefix,))],
+                    timeout=DEFAULT_RESPONSE_TIMEOUT,
                 )
-                if self._include_extended_entities
-                else None
-            ),
-            "status_sensors": status_sensors,
-        }
+                if raw:
+                    break
+            if raw and not _is_error_response(raw):
+                supported.append(command)
 
-    def _empty_status_sensors(self) -> dict[str, str | None]:
-        return {sensor_key: None for sensor_key, _, _ in STATUS_SENSOR_COMMANDS}
+        return supported
 
-    async def _async_get_status_sensors(self) -> dict[str, str | None]:
-        values: dict[str, str | None] = {}
-        for sensor_key, command, response_prefix in STATUS_SENSOR_COMMANDS:
-            raw = await self._async_query_optional(
-                command,
-                expected_prefixes=(response_prefix,),
-            )
-            parsed = self._strip_prefix(raw, response_prefix)
-            values[sensor_key] = parsed.lstrip(" :=") if parsed else None
+    def _parse_response(self, line: str) -> tuple[ResponseField, Any] | None:
+        parsed = RESPONSE_PARSERS.parse(line)
+        if parsed is None:
+            return None
+
+        entry, value = parsed
+        if entry.extended and not self._include_extended_entities:
+            return None
+        if entry.field == "source":
+            value = self._source_index.label_for_code(value)
+        return entry, value
+
+    def status_field_for_command(self, command: str) -> str | None:
+        if _is_query(command):
+            return None
+        parsed = self._parse_response(command.strip())
+        return parsed[0].field if parsed is not None else None
 
-        return values
+    def _status_updates_from_line(self, line: str) -> dict[str, Any]:
+        parsed = self._parse_response(line)
+        if parsed is None:
+            return {}
+        entry, value = parsed
+        return {entry.field: value}
 
     async def _async_ensure_source_map(self) -> None:
         if self._source_map_fetched:
@@ -325,59 +1715,48 @@ class DenonMarantzClient:
         self._source_map_fetched = True
         discovered = await self._async_fetch_source_map()
         if discovered:
-            self._source_code_to_label = discovered
-            self._source_label_to_code = {
-                label.casefold(): code for code, label in discovered.items() if label
-            }
+            self._source_index = SourceIndex.build(
+                self._source_index.version + 1,
+                discovered,
+                self._input_filter_tokens,
+            )
             self.logger.debug("Loaded %s AVR input source labels", len(discovered))
         else:
             self.logger.debug("Falling back to default input source labels")
 
     async def _async_fetch_source_map(self) -> dict[str, str]:
-        async with self._lock:
-            await self.connect()
-
-            assert self._writer is not None
-            assert self._reader is not None
+        async with self._async_reserve_prefixes(("SSFUN",)):
+            return await self._async_run_with_retry("SSFUN ?", self._async_fetch_source_map_once)
 
-            self._writer.write("SSFUN ?\r".encode("ascii"))
-            await self._writer.drain()
-
-            loop = asyncio.get_running_loop()
-            deadline = loop.time() + 2.5
-            discovered: dict[str, str] = {}
-
-            while True:
-                remaining = deadline - loop.time()
-                if remaining <= 0:
-                    break
-
-                try:
-                    response = await asyncio.wait_for(self._reader.readuntil(b"\r"), timeout=remaining)
-                except TimeoutError:
-                    break
-
-                decoded = response.decode("ascii", errors="ignore").strip()
-                upper = decoded.upper()
-
-                if upper.startswith("E"):
-                    return {}
-
-                if not upper.startswith("SSFUN"):
-                    continue
-
-                payload = decoded[5:].strip()
-                if not payload:
-                    continue
-
-                if payload.upper() == "END":
-                    break
+    async def _async_fetch_source_map_once(self, writer: _LineProtocol) -> dict[str, str]:
+        timeout = self._response_timeout("SS", SOURCE_MAP_RESPONSE_TIMEOUT)
+        pending = self._register_pending(("SSFUN",), multiline=True)
+        try:
+            await self._async_write(writer, ("SSFUN ?",), (pending,))
+            try:
+                terminator = await asyncio.wait_for(pending.future, timeout=timeout)
+            except TimeoutError:
+                terminator = None
+                self._note_response_timeout("SS")
+            else:
+                self._observe_latency("SS", pending.answered_at - pending.sent_at)
+        finally:
+            self._unregister_pending(pending)
+
+        if terminator is not None and _is_error_response(terminator):
+            return {}
+
+        discovered: dict[str, str] = {}
+        for line in pending.lines:
+            payload = line[5:].strip()
+            if not payload:
+                continue
 
-                code, label = self._parse_ssfun_payload(payload)
-                if code and label:
-                    discovered[code] = label
+            code, label = self._parse_ssfun_payload(payload)
+            if code and label:
+                discovered[code] = label
 
-            return discovered
+        return discovered
 
     @staticmethod
     def _parse_ssfun_payload(payload: str) -> tuple[str | None, str | None]:
@@ -395,47 +1774,6 @@ class DenonMarantzClient:
 
         return code, label
 
-    def _source_label_from_code(self, code: str | None) -> str | None:
-        if not code:
-            return None
-
-        normalized = code.strip().upper()
-        if normalized in self._source_code_to_label:
-            return self._source_code_to_label[normalized]
-
-        return code.strip()
-
-    def _source_options(self, current_source: str | None) -> list[str]:
-        options = list(DEFAULT_INPUT_SOURCES)
-        options.extend(self._source_code_to_label.values())
-
-        deduped: list[str] = []
-        seen: set[str] = set()
-        for option in options:
-            normalized = option.casefold()
-            if normalized in seen:
-                continue
-            seen.add(normalized)
-            deduped.append(option)
-
-        filtered = self._filter_source_options(deduped)
-        if current_source:
-            current_normalized = current_source.casefold()
-            if all(option.casefold() != current_normalized for option in filtered):
-                filtered.append(current_source)
-
-        return filtered
-
-    def _filter_source_options(self, options: list[str]) -> list[str]:
-        if not self._input_filter_tokens:
-            return options
-
-        return [
-            option
-            for option in options
-            if any(token in option.casefold() for token in self._input_filter_tokens)
-        ]
-
     @staticmethod
     def _parse_input_filter(raw_filter: str) -> tuple[str, ...]:
         return tuple(
@@ -444,140 +1782,85 @@ class DenonMarantzClient:
             if token.strip()
         )
 
-    async def _async_query_optional(
-        self,
-        command: str,
-        expected_prefixes: tuple[str, ...] | None = None,
-    ) -> str | None:
-        try:
-            return await self._async_send(command, expected_prefixes=expected_prefixes)
-        except Exception as err:
-            self.logger.debug("Optional AVR status query failed for %s: %s", command, err)
-            return None
-
     async def async_set_power(self, on: bool) -> None:
-        await self._async_send("PWON" if on else "PWSTANDBY", allow_timeout=True)
+        await self._async_send_nowait("PWON" if on else "PWSTANDBY")
 
     async def async_volume_up(self) -> None:
-        await self._async_send("MVUP", allow_timeout=True)
+        await self._async_send_nowait("MVUP")
 
     async def async_volume_down(self) -> None:
-        await self._async_send("MVDOWN", allow_timeout=True)
+        await self._async_send_nowait("MVDOWN")
 
-    async def async_set_volume_level(self, level: float) -> None:
-        avr_value = max(0, min(98, int(round(level * 98))))
-        await self._async_send(f"MV{avr_value:02d}", allow_timeout=True)
+    async def async_set_volume_level(self, level: float) -> bool:
+        avr_value = self._volume_to_avr(level)
+        return await self._async_send_coalesced("MV", f"MV{avr_value:02d}")
+
+    @classmethod
+    def normalize_volume_level(cls, level: float) -> float:
+        return cls._volume_to_avr(level) / 98.0
+
+    @staticmethod
+    def _volume_to_avr(level: float) -> int:
+        return max(0, min(98, int(round(level * 98))))
 
     async def async_set_mute(self, mute: bool) -> None:
-        await self._async_send("MUON" if mute else "MUOFF", allow_timeout=True)
+        await self._async_send_nowait("MUON" if mute else "MUOFF")
 
     async def async_set_source(self, source: str) -> None:
-        source_code = self._source_label_to_code.get(source.strip().casefold(), source)
-        await self._async_send(f"SI{source_code}", allow_timeout=True)
+        source_code = self._source_index.code_for_label(source)
+        await self._async_send_nowait(f"SI{source_code}")
+        self._invalidate_related_queries("SI")
 
     async def async_set_sound_mode(self, sound_mode: str) -> None:
         command_value = sound_mode.replace(" ", "")
-        await self._async_send(f"MS{command_value}", allow_timeout=True)
+        await self._async_send_nowait(f"MS{command_value}")
+        self._invalidate_related_queries("MS")
 
     async def async_set_dynamic_eq(self, enabled: bool) -> None:
-        await self._async_send("PSDYNEQ ON" if enabled else "PSDYNEQ OFF", allow_timeout=True)
+        await self._async_send_nowait("PSDYNEQ ON" if enabled else "PSDYNEQ OFF")
 
     async def async_set_dynamic_volume(self, option: str) -> None:
         command_value = self._dynamic_volume_command_value(option)
-        await self._async_send(f"PSDYNVOL {command_value}", allow_timeout=True)
+        await self._async_send_nowait(f"PSDYNVOL {command_value}")
 
     async def async_set_dialogue_enhancer(self, option: str) -> None:
         command_value = self._option_command_value(option, DIALOGUE_ENHANCER_OPTIONS)
-        await self._async_send(f"PSDIL {command_value}", allow_timeout=True)
+        await self._async_send_nowait(f"PSDIL {command_value}")
 
     async def async_set_dynamic_compression(self, option: str) -> None:
         command_value = self._dynamic_compression_command_value(option)
-        await self._async_send(f"PSDRC {command_value}", allow_timeout=True)
+        await self._async_send_nowait(f"PSDRC {command_value}")
 
     async def async_set_loudness(self, option: str) -> None:
         command_value = self._option_command_value(option, LOUDNESS_OPTIONS)
-        await self._async_send(f"PSLOM {command_value}", allow_timeout=True)
+        await self._async_send_nowait(f"PSLOM {command_value}")
 
     async def async_cursor_up(self) -> None:
-        await self._async_send("MNCUP", allow_timeout=True)
+        await self._async_send_nowait("MNCUP")
 
     async def async_cursor_down(self) -> None:
-        await self._async_send("MNCDN", allow_timeout=True)
+        await self._async_send_nowait("MNCDN")
 
     async def async_cursor_left(self) -> None:
-        await self._async_send("MNCLT", allow_timeout=True)
+        await self._async_send_nowait("MNCLT")
 
     async def async_cursor_right(self) -> None:
-        await self._async_send("MNCRT", allow_timeout=True)
+        await self._async_send_nowait("MNCRT")
 
     async def async_enter(self) -> None:
-        await self._async_send("MNENT", allow_timeout=True)
+        await self._async_send_nowait("MNENT")
 
     async def async_return(self) -> None:
-        await self._async_send("MNRTN", allow_timeout=True)
+        await self._async_send_nowait("MNRTN")
 
     async def async_option(self) -> None:
-        await self._async_send("MNOPT", allow_timeout=True)
+        await self._async_send_nowait("MNOPT")
 
     async def async_info(self) -> None:
-        await self._async_send("MNINF", allow_timeout=True)
+        await self._async_send_nowait("MNINF")
 
     async def async_menu(self) -> None:
-        await self._async_send("MNMEN ON", allow_timeout=True)
-
-    @staticmethod
-    def _parse_volume(raw: str) -> float:
-        value = raw.replace("MV", "")
-        try:
-            return max(0.0, min(1.0, int(value[:2]) / 98.0))
-        except (TypeError, ValueError, IndexError):
-            return 0.0
-
-    @staticmethod
-    def _parse_power(raw: str) -> str:
-        value = raw.upper().replace("PW", "", 1).strip()
-        if value.startswith("ON"):
-            return "ON"
-        return "OFF"
-
-    @staticmethod
-    def _strip_prefix(raw: str | None, prefix: str) -> str | None:
-        if not raw:
-            return None
-        upper_prefix = prefix.upper()
-        if raw.upper().startswith(upper_prefix):
-            return raw[len(prefix) :].strip() or None
-        return raw.strip() or None
-
-    @staticmethod
-    def _parse_on_off_status(raw: str | None) -> bool | None:
-        if not raw:
-            return None
-
-        normalized = raw.strip().upper()
-        if "ON" in normalized:
-            return True
-        if "OFF" in normalized:
-            return False
-
-        return None
-
-    @staticmethod
-    def _parse_dynamic_volume_status(raw: str | None) -> str | None:
-        if not raw:
-            return None
-
-        normalized = raw.strip().upper()
-        if "OFF" in normalized:
-            return "Off"
-        if "LIT" in normalized or "LIGHT" in normalized:
-            return "Light"
-        if "MED" in normalized or "MID" in normalized or "MIDDLE" in normalized:
-            return "Medium"
-        if "HEV" in normalized or "HEAVY" in normalized:
-            return "Heavy"
-
-        return None
+        await self._async_send_nowait("MNMEN ON")
 
     @staticmethod
     def _dynamic_volume_command_value(option: str) -> str:
@@ -596,26 +1879,6 @@ class DenonMarantzClient:
 
         raise ValueError(f"Unsupported Dynamic Volume option: {option}")
 
-    @staticmethod
-    def _parse_option_status(raw: str | None, options: list[str]) -> str | None:
-        if not raw:
-            return None
-
-        normalized = raw.strip().upper()
-        token_aliases: dict[str, tuple[str, ...]] = {
-            "off": ("OFF",),
-            "auto": ("AUTO",),
-            "low": ("LOW", "LIT", "LIGHT"),
-            "medium": ("MED", "MID", "MIDDLE"),
-            "high": ("HIGH", "HI", "HEV", "HEAVY"),
-        }
-        for option in options:
-            for token in token_aliases.get(option.casefold(), (option.upper(),)):
-                if token in normalized:
-                    return option
-
-        return None
-
     @staticmethod
     def _option_command_value(option: str, options: list[str]) -> str:
         normalized = option.strip().casefold()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import DenonMarantzDataUpdateCoordinator
+from .denon_protocol import DenonMarantzClient
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+) -> dict[str, Any]:
+    data = hass.data[DOMAIN][entry.entry_id]
+    client: DenonMarantzClient = data["client"]
+    coordinator: DenonMarantzDataUpdateCoordinator = data["coordinator"]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "push_connected": client.push_connected,
+        "update_interval": (
+            coordinator.update_interval.total_seconds() if coordinator.update_interval else None
+        ),
+        "query_health": client.query_health(),
+        "latency": client.latency_estimates(),
+        "metrics": client.metrics(),
+        "source_map": dict(client.source_index.code_to_label),
+        "trace": client.protocol_trace(),
+        "status": asdict(coordinator.data) if coordinator.data is not None else None,
+    }
@@ -47,7 +47,10 @@ class DenonMarantzMediaPlayer(
         coordinator: DenonMarantzDataUpdateCoordinator,
         client: DenonMarantzClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset({"power", "volume", "muted", "source"}),
+        )
         self._client = client
         self._attr_name = entry.data.get(CONF_NAME)
         self._attr_unique_id = entry.entry_id
@@ -55,62 +58,60 @@ class DenonMarantzMediaPlayer(
 
     @property
     def state(self) -> MediaPlayerState:
-        power = self.coordinator.data.get("power") if self.coordinator.data else ""
+        power = self.coordinator.data.power if self.coordinator.data else ""
         return MediaPlayerState.ON if power == "ON" else MediaPlayerState.OFF
 
     @property
     def volume_level(self) -> float | None:
         if not self.coordinator.data:
             return None
-        return self.coordinator.data.get("volume")
+        return self.coordinator.data.volume
 
     @property
     def is_volume_muted(self) -> bool | None:
         if not self.coordinator.data:
             return None
-        return self.coordinator.data.get("muted")
+        return self.coordinator.data.muted
 
     @property
     def source(self) -> str | None:
         if not self.coordinator.data:
             return None
-        return self.coordinator.data.get("source")
+        return self.coordinator.data.source
 
     @property
     def source_list(self) -> list[str] | None:
-        if not self.coordinator.data:
-            return DEFAULT_INPUT_SOURCES
-
-        source_options = self.coordinator.data.get("source_options")
-        if isinstance(source_options, list) and source_options:
-            return source_options
-
-        return DEFAULT_INPUT_SOURCES
+        return self._client.source_index.option_list(self.source) or DEFAULT_INPUT_SOURCES
 
     async def async_turn_on(self) -> None:
         await self._client.async_set_power(True)
+        self.coordinator.async_note_activity()
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self) -> None:
         await self._client.async_set_power(False)
+        self.coordinator.async_note_activity()
         await self.coordinator.async_request_refresh()
 
     async def async_volume_up(self) -> None:
         await self._client.async_volume_up()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_confirm_fields(("volume",))
 
     async def async_volume_down(self) -> None:
         await self._client.async_volume_down()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_confirm_fields(("volume",))
 
     async def async_set_volume_level(self, volume: float) -> None:
-        await self._client.async_set_volume_level(volume)
-        await self.coordinator.async_request_refresh()
+        if not await self._client.async_set_volume_level(volume):
+            return
+        await self.coordinator.async_apply_optimistic(
+            {"volume": self._client.normalize_volume_level(volume)}
+        )
 
     async def async_mute_volume(self, mute: bool) -> None:
         await self._client.async_set_mute(mute)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"muted": mute})
 
     async def async_select_source(self, source: str) -> None:
         await self._client.async_set_source(source)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"source": source})
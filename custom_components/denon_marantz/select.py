@@ -35,12 +35,14 @@ async def async_setup_entry(
 
     if entry.options.get(CONF_ADD_EXTENDED_ENTITIES, DEFAULT_ADD_EXTENDED_ENTITIES):
         entities.extend(
-            [
-                DenonMarantzDynamicVolumeSelect(entry, coordinator, client),
-                DenonMarantzDialogueEnhancerSelect(entry, coordinator, client),
-                DenonMarantzDynamicCompressionSelect(entry, coordinator, client),
-                DenonMarantzLoudnessSelect(entry, coordinator, client),
-            ]
+            entity_class(entry, coordinator, client)
+            for field, entity_class in (
+                ("dynamic_volume", DenonMarantzDynamicVolumeSelect),
+                ("dialogue_enhancer", DenonMarantzDialogueEnhancerSelect),
+                ("dynamic_compression", DenonMarantzDynamicCompressionSelect),
+                ("loudness", DenonMarantzLoudnessSelect),
+            )
+            if client.supports_field(field)
         )
 
     async_add_entities(entities)
@@ -58,7 +60,7 @@ class DenonMarantzInputSourceSelect(
         coordinator: DenonMarantzDataUpdateCoordinator,
         client: DenonMarantzClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"source"}))
         self._client = client
         self._attr_unique_id = f"{entry.entry_id}_input_source"
         self._attr_name = "Input Source"
@@ -66,34 +68,18 @@ class DenonMarantzInputSourceSelect(
 
     @property
     def options(self) -> list[str]:
-        if not self.coordinator.data:
-            return DEFAULT_INPUT_SOURCES
-
-        source_options = self.coordinator.data.get("source_options")
-        if isinstance(source_options, list) and source_options:
-            return source_options
-
-        return DEFAULT_INPUT_SOURCES
+        current = self.coordinator.data.source if self.coordinator.data else None
+        return self._client.source_index.option_list(current) or DEFAULT_INPUT_SOURCES
 
     @property
     def current_option(self) -> str | None:
         if not self.coordinator.data:
             return None
-
-        current = self.coordinator.data.get("source")
-        if not current:
-            return None
-
-        normalized = str(current).strip().upper()
-        for option in self.options:
-            if option.upper() == normalized:
-                return option
-
-        return None
+        return self._client.source_index.canonical_label(self.coordinator.data.source)
 
     async def async_select_option(self, option: str) -> None:
         await self._client.async_set_source(option)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"source": option})
 
 
 class DenonMarantzDynamicVolumeSelect(
@@ -108,7 +94,7 @@ class DenonMarantzDynamicVolumeSelect(
         coordinator: DenonMarantzDataUpdateCoordinator,
         client: DenonMarantzClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"dynamic_volume"}))
         self._client = client
         self._attr_unique_id = f"{entry.entry_id}_dynamic_volume"
         self._attr_name = "Dynamic Volume"
@@ -120,7 +106,7 @@ class DenonMarantzDynamicVolumeSelect(
         if not self.coordinator.data:
             return None
 
-        current = self.coordinator.data.get("dynamic_volume")
+        current = self.coordinator.data.dynamic_volume
         if not current:
             return None
 
@@ -133,7 +119,7 @@ class DenonMarantzDynamicVolumeSelect(
 
     async def async_select_option(self, option: str) -> None:
         await self._client.async_set_dynamic_volume(option)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"dynamic_volume": option})
 
 
 class DenonMarantzDialogueEnhancerSelect(
@@ -148,7 +134,7 @@ class DenonMarantzDialogueEnhancerSelect(
         coordinator: DenonMarantzDataUpdateCoordinator,
         client: DenonMarantzClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"dialogue_enhancer"}))
         self._client = client
         self._attr_unique_id = f"{entry.entry_id}_dialogue_enhancer"
         self._attr_name = "Dialogue Enhancer"
@@ -160,7 +146,7 @@ class DenonMarantzDialogueEnhancerSelect(
         if not self.coordinator.data:
             return None
 
-        current = self.coordinator.data.get("dialogue_enhancer")
+        current = self.coordinator.data.dialogue_enhancer
         if not current:
             return None
 
@@ -173,7 +159,7 @@ class DenonMarantzDialogueEnhancerSelect(
 
     async def async_select_option(self, option: str) -> None:
         await self._client.async_set_dialogue_enhancer(option)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"dialogue_enhancer": option})
 
 
 class DenonMarantzDynamicCompressionSelect(
@@ -188,7 +174,7 @@ class DenonMarantzDynamicCompressionSelect(
         coordinator: DenonMarantzDataUpdateCoordinator,
         client: DenonMarantzClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"dynamic_compression"}))
         self._client = client
         self._attr_unique_id = f"{entry.entry_id}_dynamic_compression"
         self._attr_name = "Dynamic Compression"
@@ -200,7 +186,7 @@ class DenonMarantzDynamicCompressionSelect(
         if not self.coordinator.data:
             return None
 
-        current = self.coordinator.data.get("dynamic_compression")
+        current = self.coordinator.data.dynamic_compression
         if not current:
             return None
 
@@ -213,7 +199,7 @@ class DenonMarantzDynamicCompressionSelect(
 
     async def async_select_option(self, option: str) -> None:
         await self._client.async_set_dynamic_compression(option)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"dynamic_compression": option})
 
 
 class DenonMarantzLoudnessSelect(
@@ -228,7 +214,7 @@ class DenonMarantzLoudnessSelect(
         coordinator: DenonMarantzDataUpdateCoordinator,
         client: DenonMarantzClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"loudness"}))
         self._client = client
         self._attr_unique_id = f"{entry.entry_id}_loudness"
         self._attr_name = "Loudness"
@@ -240,7 +226,7 @@ class DenonMarantzLoudnessSelect(
         if not self.coordinator.data:
             return None
 
-        current = self.coordinator.data.get("loudness")
+        current = self.coordinator.data.loudness
         if not current:
             return None
 
@@ -253,4 +239,4 @@ class DenonMarantzLoudnessSelect(
 
     async def async_select_option(self, option: str) -> None:
         await self._client.async_set_loudness(option)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"loudness": option})
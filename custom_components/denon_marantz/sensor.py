@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -13,8 +18,34 @@ from .const import (
     STATUS_SENSOR_COMMANDS,
 )
 from .coordinator import DenonMarantzDataUpdateCoordinator
+from .denon_protocol import DenonMarantzClient
 from .entity import build_device_info
 
+METRIC_SENSORS: tuple[tuple[str, str | None, SensorDeviceClass | None, SensorStateClass], ...] = (
+    (
+        "last_poll_duration",
+        UnitOfTime.SECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+    ),
+    (
+        "mean_round_trip",
+        UnitOfTime.SECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+    ),
+    ("timeouts", None, None, SensorStateClass.TOTAL_INCREASING),
+    ("retries", None, None, SensorStateClass.TOTAL_INCREASING),
+    ("reconnects", None, None, SensorStateClass.TOTAL_INCREASING),
+    (
+        "lock_wait",
+        UnitOfTime.SECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.TOTAL_INCREASING,
+    ),
+    ("discarded_lines", None, None, SensorStateClass.TOTAL_INCREASING),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,16 +54,22 @@ async def async_setup_entry(
 ) -> None:
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: DenonMarantzDataUpdateCoordinator = data["coordinator"]
+    client: DenonMarantzClient = data["client"]
 
     entities: list[SensorEntity] = [
         DenonMarantzSoundModeSensor(entry, coordinator),
+        *(
+            DenonMarantzMetricSensor(entry, client, key, unit, device_class, state_class)
+            for key, unit, device_class, state_class in METRIC_SENSORS
+        ),
     ]
 
     if entry.options.get(CONF_ADD_EXTENDED_ENTITIES, DEFAULT_ADD_EXTENDED_ENTITIES):
         entities.extend(
             [
                 DenonMarantzStatusSensor(entry, coordinator, sensor_key)
-                for sensor_key, _, _ in STATUS_SENSOR_COMMANDS
+                for sensor_key, command, _, _ in STATUS_SENSOR_COMMANDS
+                if client.supports_query(command)
             ]
         )
 
@@ -51,7 +88,7 @@ class DenonMarantzSoundModeSensor(
         entry: ConfigEntry,
         coordinator: DenonMarantzDataUpdateCoordinator,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"sound_mode"}))
         self._attr_unique_id = f"{entry.entry_id}_sound_mode"
         self._attr_device_info = build_device_info(entry)
 
@@ -59,7 +96,7 @@ class DenonMarantzSoundModeSensor(
     def native_value(self) -> str | None:
         if not self.coordinator.data:
             return None
-        value = self.coordinator.data.get("sound_mode")
+        value = self.coordinator.data.sound_mode
         return value if isinstance(value, str) else None
 
 
@@ -75,7 +112,7 @@ class DenonMarantzStatusSensor(
         coordinator: DenonMarantzDataUpdateCoordinator,
         sensor_key: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({sensor_key}))
         self._sensor_key = sensor_key
         self._attr_translation_key = sensor_key
         self._attr_unique_id = f"{entry.entry_id}_{sensor_key}"
@@ -86,9 +123,34 @@ class DenonMarantzStatusSensor(
         if not self.coordinator.data:
             return None
 
-        status_sensors = self.coordinator.data.get("status_sensors")
-        if not isinstance(status_sensors, dict):
-            return None
-
-        value = status_sensors.get(self._sensor_key)
+        value = getattr(self.coordinator.data, self._sensor_key)
         return value if isinstance(value, str) else None
+
+
+class DenonMarantzMetricSensor(SensorEntity):
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        client: DenonMarantzClient,
+        key: str,
+        unit: str | None,
+        device_class: SensorDeviceClass | None,
+        state_class: SensorStateClass,
+    ) -> None:
+        self._client = client
+        self._key = key
+        self._attr_translation_key = key
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_state_class = state_class
+        if device_class is SensorDeviceClass.DURATION:
+            self._attr_suggested_display_precision = 3
+        self._attr_device_info = build_device_info(entry)
+
+    async def async_update(self) -> None:
+        self._attr_native_value = self._client.metrics()[self._key]
@@ -23,6 +23,8 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: DenonMarantzDataUpdateCoordinator = data["coordinator"]
     client: DenonMarantzClient = data["client"]
+    if not client.supports_field("dynamic_eq"):
+        return
 
     async_add_entities([DenonMarantzDynamicEqSwitch(entry, coordinator, client)])
 
@@ -40,7 +42,7 @@ class DenonMarantzDynamicEqSwitch(
         coordinator: DenonMarantzDataUpdateCoordinator,
         client: DenonMarantzClient,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({"dynamic_eq"}))
         self._client = client
         self._attr_unique_id = f"{entry.entry_id}_dynamic_eq"
         self._attr_device_info = build_device_info(entry)
@@ -50,13 +52,13 @@ class DenonMarantzDynamicEqSwitch(
         if not self.coordinator.data:
             return None
 
-        value = self.coordinator.data.get("dynamic_eq")
+        value = self.coordinator.data.dynamic_eq
         return value if isinstance(value, bool) else None
 
     async def async_turn_on(self, **kwargs) -> None:
         await self._client.async_set_dynamic_eq(True)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"dynamic_eq": True})
 
     async def async_turn_off(self, **kwargs) -> None:
         await self._client.async_set_dynamic_eq(False)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_apply_optimistic({"dynamic_eq": False})
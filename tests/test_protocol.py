@@ -0,0 +1,426 @@
+"""Drive DenonMarantzClient against the AVR emulator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _integration import load
+from avr_emulator import AvrEmulator, AvrState, EmulatorConfig
+from replay_capture import CaptureReplayServer, load_capture
+
+const = load("const")
+protocol = load("denon_protocol")
+
+FAST = EmulatorConfig(latency=0.005)
+
+
+@asynccontextmanager
+async def _running(
+    config: EmulatorConfig = FAST,
+    state: AvrState | None = None,
+    **options: Any,
+) -> AsyncIterator[tuple[AvrEmulator, protocol.DenonMarantzClient]]:
+    async with AvrEmulator(config=config, state=state) as emulator:
+        client = protocol.DenonMarantzClient("127.0.0.1", emulator.port, **options)
+        try:
+            yield emulator, client
+        finally:
+            await client.disconnect()
+
+
+async def _wait_for(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+def _received(client: protocol.DenonMarantzClient) -> list[str]:
+    return [entry["data"] for entry in client.protocol_trace() if entry["direction"] == "rx"]
+
+
+async def test_status_poll_reads_base_fields() -> None:
+    async with _running() as (_, client):
+        status = await client.async_get_status()
+
+    assert status.power == "ON"
+    assert status.volume == 45 / 98
+    assert status.source == "CD Player"
+    assert status.muted is False
+    assert status.sound_mode == "STEREO"
+
+
+async def test_status_queries_are_pipelined_in_one_write() -> None:
+    async with _running(include_extended_entities=True) as (_, client):
+        status = await client.async_get_status()
+
+    writes = [entry for entry in client.protocol_trace() if entry["direction"] == "tx"]
+    start = next(index for index, entry in enumerate(writes) if entry["data"] == "MV?\r")
+    batch = [entry["data"] for entry in writes if entry["t"] == writes[start]["t"]]
+    assert batch[:4] == ["MV?\r", "SI?\r", "MU?\r", "MS?\r"]
+    assert f"{const.LOUDNESS_QUERY_COMMAND}\r" in batch
+    assert status.dynamic_eq is True
+    assert status.dynamic_compression == "Auto"
+    assert status.multi_eq_status == "AUDYSSEY"
+
+
+async def test_pushed_lines_update_status() -> None:
+    async with _running() as (emulator, client):
+        await client.async_get_status()
+        changes: list[dict[str, Any]] = []
+        client.add_status_listener(changes.append)
+
+        emulator.set_volume(60)
+        emulator.set_mute(True)
+        await _wait_for(lambda: len(changes) == 2)
+
+    assert changes == [{"volume": 60 / 98}, {"muted": True}]
+
+
+async def test_pushes_during_the_first_poll_are_kept() -> None:
+    config = EmulatorConfig(latency=0.005, silent=frozenset({"PSDIL"}))
+    async with _running(
+        config,
+        include_extended_entities=True,
+        max_response_timeout=0.3,
+    ) as (emulator, client):
+        poll = asyncio.ensure_future(client.async_get_status())
+        await _wait_for(lambda: "MV45" in _received(client))
+        emulator.set_volume(60)
+        status = await poll
+
+    assert status.volume == 60 / 98
+
+
+async def test_slow_tiers_are_not_polled_every_cycle() -> None:
+    async with _running(include_extended_entities=True) as (emulator, client):
+        await client.async_get_status()
+        emulator.received.clear()
+        await client.async_get_status()
+
+    assert "MV?" in emulator.received
+    assert const.DYNAMIC_EQ_QUERY_COMMAND not in emulator.received
+    assert const.LOUDNESS_QUERY_COMMAND not in emulator.received
+
+
+async def test_unanswered_query_is_negatively_cached() -> None:
+    config = EmulatorConfig(latency=0.005, unsupported=frozenset({"PSMULTEQ"}))
+    async with _running(config, include_extended_entities=True) as (emulator, client):
+        for _ in range(const.QUERY_FAILURE_THRESHOLD):
+            await client.async_get_status()
+        emulator.received.clear()
+        await client.async_get_status()
+        health = client.query_health()
+
+    assert health[const.MULTI_EQ_QUERY_COMMAND]["unsupported"] is True
+    assert health[const.MULTI_EQ_QUERY_COMMAND]["last_error"] == "E"
+    assert const.MULTI_EQ_QUERY_COMMAND not in emulator.received
+
+
+async def test_unanswered_base_query_is_never_negatively_cached() -> None:
+    config = EmulatorConfig(latency=0.005, silent=frozenset({"MS"}))
+    async with _running(config, max_response_timeout=0.3) as (emulator, client):
+        for _ in range(const.QUERY_FAILURE_THRESHOLD + 1):
+            await client.async_get_status()
+        emulator.config.silent = frozenset()
+        emulator.received.clear()
+        status = await client.async_get_status()
+        health = client.query_health()
+
+    assert "MS?" in emulator.received
+    assert "MS?" not in health
+    assert status.sound_mode == "STEREO"
+
+
+async def test_send_commands_pipelines_a_batch() -> None:
+    async with _running() as (emulator, client):
+        await client.async_get_status()
+        results = await client.async_send_commands(
+            [
+                protocol.CommandRequest("MV?"),
+                protocol.CommandRequest("MU?"),
+                protocol.CommandRequest("PSBAS ?", timeout=0.2, allow_timeout=True),
+            ]
+        )
+
+    assert [result.response for result in results] == ["MV45", "MUOFF", ""]
+    assert emulator.received[-3:] == ["MV?", "MU?", "PSBAS ?"]
+
+
+async def test_volume_writes_are_coalesced() -> None:
+    async with _running(continuous_write_interval=0.05) as (emulator, client):
+        await client.async_get_status()
+        emulator.received.clear()
+        await asyncio.gather(
+            *(client.async_set_volume_level(level / 98) for level in range(20, 40))
+        )
+        await _wait_for(lambda: emulator.state.volume == 39)
+
+    writes = [command for command in emulator.received if command.startswith("MV")]
+    assert writes[-1] == "MV39"
+    assert len(writes) < 20
+
+
+async def test_reply_timeout_does_not_reset_the_connection() -> None:
+    config = EmulatorConfig(latency=0.005, silent=frozenset({"ZZ"}))
+    async with _running(config) as (_, client):
+        await client.async_get_status()
+        silent, volume = await asyncio.gather(
+            client.async_send_command("ZZ?", timeout=0.5),
+            client.async_send_command("MV?"),
+            return_exceptions=True,
+        )
+        metrics = client.metrics()
+
+    assert isinstance(silent, TimeoutError)
+    assert volume == "MV45"
+    assert metrics["timeouts"] == 1
+    assert metrics["retries"] == 0
+    assert metrics["reconnects"] == 0
+
+
+async def test_queries_with_different_timeouts_are_not_shared() -> None:
+    async with _running(EmulatorConfig(latency=0.3)) as (_, client):
+        short, long = await asyncio.gather(
+            client.async_send_command("MV?", timeout=0.1),
+            client.async_send_command("MV?", timeout=1.0),
+            return_exceptions=True,
+        )
+
+    assert isinstance(short, TimeoutError)
+    assert long == "MV45"
+
+
+async def test_unanswered_power_poll_reconnects_a_silent_link() -> None:
+    async with _running(max_response_timeout=0.3) as (emulator, client):
+        await client.async_get_status()
+        emulator.config.silent = frozenset({""})
+        with pytest.raises(TimeoutError):
+            await client.async_get_status()
+        assert not client.push_connected
+
+        emulator.config.silent = frozenset()
+        status = await client.async_get_status()
+        metrics = client.metrics()
+
+    assert status.volume == 45 / 98
+    assert metrics["reconnects"] == 1
+
+
+async def test_error_reply_goes_to_the_command_that_caused_it() -> None:
+    config = EmulatorConfig(latency=0.02, unsupported=frozenset({"XX"}))
+    async with _running(config) as (_, client):
+        status, error = await asyncio.gather(
+            client.async_get_status(),
+            client.async_send_command("XX?", timeout=0.5),
+        )
+        health = client.query_health()
+        metrics = client.metrics()
+
+    assert error == "E"
+    assert status.volume == 45 / 98
+    assert "MV?" not in health
+    assert metrics["timeouts"] == 0
+    assert metrics["retries"] == 0
+
+
+async def test_cancelled_batch_does_not_take_a_later_error_reply() -> None:
+    config = EmulatorConfig(
+        latency=0.005,
+        silent=frozenset({"ZZ"}),
+        unsupported=frozenset({"XX"}),
+    )
+    async with _running(config) as (emulator, client):
+        await client.async_get_status()
+        batch = asyncio.ensure_future(
+            client.async_send_commands([protocol.CommandRequest("ZZ?", timeout=5.0)])
+        )
+        await _wait_for(lambda: "ZZ?" in emulator.received)
+        batch.cancel()
+        await asyncio.gather(batch, return_exceptions=True)
+        response = await client.async_send_command("XX?", timeout=0.5)
+
+    assert response == "E"
+
+
+async def test_ambiguous_error_in_a_batch_is_verified_per_query() -> None:
+    config = EmulatorConfig(
+        latency=0.005,
+        silent=frozenset({"PSDIL"}),
+        unsupported=frozenset({"PSDRC"}),
+    )
+    async with _running(
+        config,
+        include_extended_entities=True,
+        max_response_timeout=0.3,
+    ) as (_, client):
+        status = await client.async_get_status()
+        health = client.query_health()
+
+    assert health[const.DIALOGUE_ENHANCER_QUERY_COMMAND]["last_error"] == "timeout"
+    assert health[const.DYNAMIC_COMPRESSION_QUERY_COMMAND]["last_error"] == "E"
+    assert set(health) == {
+        const.DIALOGUE_ENHANCER_QUERY_COMMAND,
+        const.DYNAMIC_COMPRESSION_QUERY_COMMAND,
+    }
+    assert status.loudness == "Off"
+
+
+async def test_error_reply_to_a_setter_does_not_answer_the_next_query() -> None:
+    config = EmulatorConfig(latency=0.02, unsupported=frozenset({"PSDYNEQ"}))
+    async with _running(config) as (_, client):
+        await client.async_get_status()
+        await client.async_set_dynamic_eq(True)
+        response = await client.async_send_command("MV?")
+
+    assert response == "MV45"
+
+
+async def test_setters_in_a_batch_keep_the_command_interval() -> None:
+    async with _running() as (_, client):
+        await client.async_get_status()
+        await client.async_send_commands(
+            [
+                protocol.CommandRequest("MV30", allow_timeout=True),
+                protocol.CommandRequest("MUON", allow_timeout=True),
+                protocol.CommandRequest("SI?"),
+                protocol.CommandRequest("MS?"),
+            ]
+        )
+        writes = [entry for entry in client.protocol_trace() if entry["direction"] == "tx"]
+
+    assert [entry["data"] for entry in writes[-4:]] == ["MV30\r", "MUON\r", "SI?\r", "MS?\r"]
+    times = [entry["t"] for entry in writes[-4:]]
+    assert times[1] - times[0] >= const.MIN_COMMAND_INTERVAL - 0.001
+    assert times[2] - times[1] >= const.MIN_COMMAND_INTERVAL - 0.001
+    assert times[3] == times[2]
+
+
+async def test_timeout_backoff_applies_above_the_floor() -> None:
+    client = protocol.DenonMarantzClient("127.0.0.1", 23)
+    for _ in range(8):
+        client._observe_latency("MV", 0.01)
+    assert client._response_timeout("MV") == const.DEFAULT_MIN_RESPONSE_TIMEOUT
+
+    client._note_response_timeout("MV")
+    assert client._response_timeout("MV") == 2 * const.DEFAULT_MIN_RESPONSE_TIMEOUT
+
+
+async def test_slow_power_reply_after_fast_replies_does_not_time_out() -> None:
+    async with _running() as (emulator, client):
+        for _ in range(4):
+            await client.async_get_status()
+        emulator.config.latency = 0.35
+        status = await client.async_get_status()
+        metrics = client.metrics()
+
+    assert status.power == "ON"
+    assert metrics["timeouts_by_family"].get("PW", 0) == 0
+
+
+async def test_superseded_volume_writes_report_false() -> None:
+    async with _running(continuous_write_interval=0.05) as (emulator, client):
+        await client.async_get_status()
+        first = asyncio.ensure_future(client.async_set_volume_level(20 / 98))
+        await asyncio.sleep(0.01)
+        results = await asyncio.gather(
+            first,
+            *(client.async_set_volume_level(level / 98) for level in range(21, 30)),
+        )
+        await _wait_for(lambda: emulator.state.volume == 29)
+
+    assert results[0] is True
+    assert results[-1] is True
+    assert not any(results[1:-1])
+
+
+async def test_probe_retries_a_missing_answer_and_excludes_errors() -> None:
+    config = EmulatorConfig(
+        latency=0.005,
+        unsupported=frozenset({"PSDIL"}),
+        silent=frozenset({"PSLOM"}),
+    )
+    async with _running(config) as (emulator, client):
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.5, setattr, emulator.config, "silent", frozenset())
+        capabilities = await client.async_probe_capabilities()
+
+    assert capabilities is not None
+    assert const.LOUDNESS_QUERY_COMMAND in capabilities
+    assert const.DIALOGUE_ENHANCER_QUERY_COMMAND not in capabilities
+    assert emulator.received.count(const.LOUDNESS_QUERY_COMMAND) == 2
+    assert emulator.received.count(const.DIALOGUE_ENHANCER_QUERY_COMMAND) == 1
+
+
+async def test_crlf_terminated_frames_are_parsed() -> None:
+    async with _running() as (emulator, client):
+        await client.async_get_status()
+        changes: list[dict[str, Any]] = []
+        client.add_status_listener(changes.append)
+        discarded = client.metrics()["discarded_lines"]
+
+        for connection in emulator._connections:
+            connection.writer.write(b"MV30\r\n\nMUON\r\n")
+        await _wait_for(lambda: len(changes) == 2)
+
+    assert changes == [{"volume": 30 / 98}, {"muted": True}]
+    assert client.metrics()["discarded_lines"] == discarded
+
+
+async def test_polled_fields_list_only_the_fields_read_this_cycle() -> None:
+    async with _running(include_extended_entities=True) as (emulator, client):
+        await client.async_get_status()
+        assert "loudness" in client.polled_fields
+
+        await client.async_get_status()
+        assert "volume" in client.polled_fields
+        assert "loudness" not in client.polled_fields
+
+        emulator.set_power(False)
+        await client.async_get_status()
+        assert "loudness" in client.polled_fields
+
+
+async def test_status_field_for_command_maps_setters_to_fields() -> None:
+    client = protocol.DenonMarantzClient("127.0.0.1", 23, include_extended_entities=True)
+
+    assert client.status_field_for_command("PSLOM ON") == "loudness"
+    assert client.status_field_for_command("MV45") == "volume"
+    assert client.status_field_for_command("PWON") == "power"
+    assert client.status_field_for_command("MV?") is None
+    assert client.status_field_for_command("MNCUP") is None
+
+
+async def test_capture_replays_against_a_fresh_client(tmp_path: Path) -> None:
+    path = tmp_path / "capture.jsonl"
+    async with _running() as (emulator, client):
+        await client.async_start_capture(str(path))
+        recorded = await client.async_get_status()
+        await asyncio.sleep(0.2)
+        emulator.set_volume(60)
+        await _wait_for(lambda: "MV60" in _received(client))
+    await _wait_for(lambda: '"disconnect"' in path.read_text())
+
+    _, records = load_capture(path)
+    async with CaptureReplayServer(records) as server:
+        client = protocol.DenonMarantzClient("127.0.0.1", server.port)
+        try:
+            replayed = await client.async_get_status()
+            await _wait_for(lambda: "MV60" in _received(client))
+        finally:
+            await client.disconnect()
+
+    assert replayed == recorded
+    assert server.unmatched_requests == 0
+
+
+async def test_capture_reports_a_file_it_cannot_open(tmp_path: Path) -> None:
+    client = protocol.DenonMarantzClient("127.0.0.1", 23)
+    with pytest.raises(OSError):
+        await client.async_start_capture(str(tmp_path / "missing" / "capture.jsonl"))
+
+    assert client.capture_path is None
@@ -0,0 +1,19 @@
+"""Import the integration's protocol modules without Home Assistant installed."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+INTEGRATION_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "denon_marantz"
+PACKAGE = "denon_marantz"
+
+
+def load(name: str) -> ModuleType:
+    if PACKAGE not in sys.modules:
+        package = ModuleType(PACKAGE)
+        package.__path__ = [str(INTEGRATION_DIR)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
@@ -0,0 +1,365 @@
+"""Emulate a Denon/Marantz AVR control port for local testing.
+
+Run ``python tools/avr_emulator.py --port 2323`` and point the integration (or
+``DenonMarantzClient``) at ``127.0.0.1:2323``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from _integration import load
+
+const = load("const")
+
+DEFAULT_SOURCES: dict[str, str] = {
+    "CD": "CD Player",
+    "TV": "TV Audio",
+    "BD": "Blu-ray",
+    "GAME": "Game",
+    "BT": "Bluetooth",
+    "TUNER": "Tuner",
+}
+DEFAULT_PARAMETERS: dict[str, str] = {
+    const.DYNAMIC_EQ_RESPONSE_PREFIX: " ON",
+    const.DYNAMIC_VOLUME_RESPONSE_PREFIX: " OFF",
+    const.DIALOGUE_ENHANCER_RESPONSE_PREFIX: " OFF",
+    const.DYNAMIC_COMPRESSION_RESPONSE_PREFIX: " AUTO",
+    const.LOUDNESS_RESPONSE_PREFIX: " OFF",
+    "PSCINEMA EQ": ".OFF",
+    "PSMULTEQ": ":AUDYSSEY",
+}
+MAX_VOLUME = 98
+
+
+@dataclass(slots=True)
+class EmulatorConfig:
+    latency: float = 0.02
+    jitter: float = 0.0
+    drop_rate: float = 0.0
+    reset_rate: float = 0.0
+    unsupported: frozenset[str] = frozenset()
+    silent: frozenset[str] = frozenset()
+    seed: int | None = None
+
+
+@dataclass(slots=True)
+class AvrState:
+    power: str = "ON"
+    volume: int = 45
+    muted: bool = False
+    source: str = "CD"
+    sound_mode: str = "STEREO"
+    parameters: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_PARAMETERS))
+    sources: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_SOURCES))
+
+
+class _Connection:
+    __slots__ = ("writer", "_last_due", "_queue", "_sender")
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self._last_due = 0.0
+        self._queue: asyncio.Queue[tuple[float, tuple[str, ...]]] = asyncio.Queue()
+        self._sender = asyncio.get_running_loop().create_task(self._async_send_queued())
+
+    def send_later(self, lines: Iterable[str], delay: float) -> None:
+        due = max(self._last_due, asyncio.get_running_loop().time() + delay)
+        self._last_due = due
+        self._queue.put_nowait((due, tuple(lines)))
+
+    async def _async_send_queued(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due, lines = await self._queue.get()
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.send_now(lines)
+
+    def send_now(self, lines: Iterable[str]) -> None:
+        if self.writer.is_closing():
+            return
+        self.writer.write("".join(f"{line}\r" for line in lines).encode("ascii"))
+
+    def close(self, abort: bool = False) -> None:
+        self._sender.cancel()
+        if abort:
+            self.writer.transport.abort()
+        else:
+            self.writer.close()
+
+
+class AvrEmulator:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        config: EmulatorConfig | None = None,
+        state: AvrState | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.config = config or EmulatorConfig()
+        self.state = state or AvrState()
+        self.received: list[str] = []
+        self._random = random.Random(self.config.seed)
+        self._connections: set[_Connection] = set()
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> AvrEmulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        for connection in list(self._connections):
+            connection.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    def broadcast(self, *lines: str) -> None:
+        for connection in list(self._connections):
+            connection.send_now(lines)
+
+    def reset_connections(self) -> None:
+        for connection in list(self._connections):
+            connection.close(abort=True)
+
+    def set_power(self, on: bool) -> None:
+        self.state.power = "ON" if on else "STANDBY"
+        self.broadcast(*self._power_lines())
+
+    def set_volume(self, volume: int) -> None:
+        self.state.volume = max(0, min(MAX_VOLUME, volume))
+        self.broadcast(*self._volume_lines())
+
+    def set_mute(self, muted: bool) -> None:
+        self.state.muted = muted
+        self.broadcast(self._mute_line())
+
+    def set_source(self, source: str) -> None:
+        self.state.source = source
+        self.broadcast(f"SI{source}")
+
+    def set_sound_mode(self, sound_mode: str) -> None:
+        self.state.sound_mode = sound_mode
+        self.broadcast(f"MS{sound_mode}")
+
+    def set_parameter(self, prefix: str, value: str) -> None:
+        self.state.parameters[prefix] = value
+        self.broadcast(f"{prefix}{value}")
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        connection = _Connection(writer)
+        self._connections.add(connection)
+        try:
+            while True:
+                raw = await reader.readuntil(b"\r")
+                command = raw.decode("ascii", errors="ignore").strip()
+                if not command:
+                    continue
+                self.received.append(command)
+                if self._chance(self.config.reset_rate):
+                    connection.close(abort=True)
+                    return
+                self._handle_command(connection, command)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            self._connections.discard(connection)
+            connection.close()
+
+    def _handle_command(self, connection: _Connection, command: str) -> None:
+        upper = command.upper()
+        if _matches(upper, self.config.silent):
+            return
+        if _matches(upper, self.config.unsupported):
+            self._reply(connection, ("E",))
+            return
+
+        query = upper.endswith("?")
+        lines = self._query(upper) if query else self._apply(upper)
+        if not lines:
+            return
+        if query:
+            self._reply(connection, lines)
+            return
+
+        for other in list(self._connections):
+            if other is connection:
+                self._reply(connection, lines)
+            else:
+                other.send_now(lines)
+
+    def _reply(self, connection: _Connection, lines: Iterable[str]) -> None:
+        if self._chance(self.config.drop_rate):
+            return
+        delay = self.config.latency
+        if self.config.jitter:
+            delay += self._random.uniform(0.0, self.config.jitter)
+        connection.send_later(lines, delay)
+
+    def _query(self, upper: str) -> tuple[str, ...]:
+        key = upper[:-1].strip()
+        if key == "PW":
+            return self._power_lines()
+        if key == "ZM":
+            return (f"ZM{'ON' if self.state.power == 'ON' else 'OFF'}",)
+        if key == "MV":
+            return self._volume_lines()
+        if key == "MU":
+            return (self._mute_line(),)
+        if key == "SI":
+            return (f"SI{self.state.source}",)
+        if key == "MS":
+            return (f"MS{self.state.sound_mode}",)
+        if key == "SSFUN":
+            return (
+                *(f"SSFUN{code} {label}" for code, label in self.state.sources.items()),
+                "SSFUN END",
+            )
+
+        prefix = self._parameter_prefix(upper)
+        if prefix is not None:
+            return (f"{prefix}{self.state.parameters[prefix]}",)
+        return ()
+
+    def _apply(self, upper: str) -> tuple[str, ...]:
+        if upper in ("PWON", "ZMON"):
+            self.state.power = "ON"
+            return self._power_lines()
+        if upper in ("PWSTANDBY", "ZMOFF"):
+            self.state.power = "STANDBY"
+            return self._power_lines()
+        if upper.startswith("MV"):
+            value = upper[2:]
+            if value == "UP":
+                self.state.volume = min(MAX_VOLUME, self.state.volume + 1)
+            elif value == "DOWN":
+                self.state.volume = max(0, self.state.volume - 1)
+            elif value[:2].isdigit():
+                self.state.volume = max(0, min(MAX_VOLUME, int(value[:2])))
+            else:
+                return ()
+            return self._volume_lines()
+        if upper in ("MUON", "MUOFF"):
+            self.state.muted = upper == "MUON"
+            return (self._mute_line(),)
+        if upper.startswith("SI"):
+            if upper[2:] not in self.state.sources:
+                return ()
+            self.state.source = upper[2:]
+            return (upper,)
+        if upper.startswith("MS") and len(upper) > 2:
+            self.state.sound_mode = upper[2:]
+            return (upper,)
+
+        prefix = self._parameter_prefix(upper)
+        if prefix is None:
+            return ()
+        self.state.parameters[prefix] = upper[len(prefix) :]
+        return (upper,)
+
+    def _parameter_prefix(self, upper: str) -> str | None:
+        matched: str | None = None
+        for prefix in self.state.parameters:
+            if upper.startswith(prefix) and (matched is None or len(prefix) > len(matched)):
+                matched = prefix
+        return matched
+
+    def _power_lines(self) -> tuple[str, ...]:
+        zone = "ON" if self.state.power == "ON" else "OFF"
+        return (f"PW{self.state.power}", f"ZM{zone}")
+
+    def _volume_lines(self) -> tuple[str, ...]:
+        return (f"MV{self.state.volume:02d}", f"MVMAX {MAX_VOLUME}")
+
+    def _mute_line(self) -> str:
+        return f"MU{'ON' if self.state.muted else 'OFF'}"
+
+    def _chance(self, rate: float) -> bool:
+        return rate > 0 and self._random.random() < rate
+
+
+def _matches(upper: str, prefixes: Iterable[str]) -> bool:
+    return any(upper.startswith(prefix.upper()) for prefix in prefixes)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2323)
+    parser.add_argument("--latency", type=float, default=0.02, help="reply delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="share of replies dropped")
+    parser.add_argument(
+        "--reset-rate",
+        type=float,
+        default=0.0,
+        help="share of commands that reset the connection",
+    )
+    parser.add_argument(
+        "--unsupported",
+        action="append",
+        default=[],
+        metavar="PREFIX",
+        help="answer commands with this prefix with E",
+    )
+    parser.add_argument(
+        "--silent",
+        action="append",
+        default=[],
+        metavar="PREFIX",
+        help="never answer commands with this prefix",
+    )
+    parser.add_argument("--seed", type=int)
+    return parser.parse_args(argv)
+
+
+def config_from_args(args: argparse.Namespace) -> EmulatorConfig:
+    return EmulatorConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        reset_rate=args.reset_rate,
+        unsupported=frozenset(args.unsupported),
+        silent=frozenset(args.silent),
+        seed=args.seed,
+    )
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    emulator = AvrEmulator(args.host, args.port, config_from_args(args))
+    await emulator.start()
+    print(f"AVR emulator listening on {emulator.host}:{emulator.port}")
+    with contextlib.suppress(asyncio.CancelledError):
+        await emulator.serve_forever()
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(_parse_args()))
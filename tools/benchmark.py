@@ -0,0 +1,263 @@
+"""Benchmark DenonMarantzClient against the local AVR emulator.
+
+Run ``python tools/benchmark.py --output bench.json`` and compare the JSON
+between releases.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from _integration import load
+from avr_emulator import AvrEmulator, EmulatorConfig
+from replay_capture import load_capture
+
+protocol = load("denon_protocol")
+
+UNSOLICITED_LINES: tuple[bytes, ...] = (
+    b"MV45\r",
+    b"MVMAX 98\r",
+    b"MV46\r",
+    b"MUON\r",
+    b"MUOFF\r",
+    b"PSDYNVOL HEV\r",
+    b"PSDYNVOL LIT\r",
+    b"PSCINEMA EQ.ON\r",
+    b"Z2ON\r",
+    b"NSE1Now Playing\r",
+)
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    return {
+        "count": len(samples),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+        "p50_ms": round(_percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(_percentile(samples, 99) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+async def _async_timed(
+    operation: Callable[[], Awaitable[Any]],
+    iterations: int,
+) -> tuple[list[float], float]:
+    wall: list[float] = []
+    cpu_start = time.process_time()
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await operation()
+        wall.append(time.perf_counter() - started)
+    return wall, time.process_time() - cpu_start
+
+
+async def _async_bench_poll(
+    emulator: AvrEmulator,
+    include_extended: bool,
+    iterations: int,
+) -> dict[str, Any]:
+    client = protocol.DenonMarantzClient(
+        "127.0.0.1",
+        emulator.port,
+        include_extended_entities=include_extended,
+    )
+    try:
+        await client.async_get_status()
+
+        async def _async_full_poll() -> None:
+            client._query_refreshed_at.clear()
+            await client.async_get_status()
+
+        full_wall, full_cpu = await _async_timed(_async_full_poll, iterations)
+        steady_wall, steady_cpu = await _async_timed(client.async_get_status, iterations)
+    finally:
+        await client.disconnect()
+
+    return {
+        "full": {**_summary(full_wall), "cpu_ms_per_poll": round(full_cpu / iterations * 1000, 3)},
+        "steady": {
+            **_summary(steady_wall),
+            "cpu_ms_per_poll": round(steady_cpu / iterations * 1000, 3),
+        },
+    }
+
+
+async def _async_bench_throughput(emulator: AvrEmulator, iterations: int) -> dict[str, Any]:
+    client = protocol.DenonMarantzClient("127.0.0.1", emulator.port)
+    commands = ("MV?", "MU?", "SI?", "MS?")
+    try:
+        await client.async_send_command("PW?")
+        cpu_start = time.process_time()
+        started = time.perf_counter()
+        for index in range(iterations):
+            await client.async_send_command(commands[index % len(commands)])
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_start
+    finally:
+        await client.disconnect()
+
+    return {
+        "commands": iterations,
+        "commands_per_second": round(iterations / elapsed, 1),
+        "cpu_ms_per_command": round(cpu / iterations * 1000, 3),
+    }
+
+
+async def _async_bench_command_during_poll(
+    emulator: AvrEmulator,
+    iterations: int,
+    seed: int,
+) -> dict[str, Any]:
+    client = protocol.DenonMarantzClient(
+        "127.0.0.1",
+        emulator.port,
+        include_extended_entities=True,
+    )
+    rng = random.Random(seed)
+    stop = asyncio.Event()
+
+    async def _async_poll_forever() -> None:
+        while not stop.is_set():
+            client._query_refreshed_at.clear()
+            await client.async_get_status()
+
+    try:
+        await client.async_get_status()
+        poller = asyncio.get_running_loop().create_task(_async_poll_forever())
+        samples: list[float] = []
+        for index in range(iterations):
+            await asyncio.sleep(rng.uniform(0.0, 0.02))
+            started = time.perf_counter()
+            await client.async_send_command("MUON" if index % 2 else "MUOFF")
+            samples.append(time.perf_counter() - started)
+        stop.set()
+        await poller
+    finally:
+        await client.disconnect()
+
+    return _summary(samples)
+
+
+async def _async_bench_unsolicited(
+    emulator: AvrEmulator,
+    lines: int,
+    frames: tuple[bytes, ...] = UNSOLICITED_LINES,
+) -> dict[str, Any]:
+    client = protocol.DenonMarantzClient(
+        "127.0.0.1",
+        emulator.port,
+        include_extended_entities=True,
+    )
+    try:
+        await client.async_get_status()
+        framer = protocol._LineProtocol(client._handle_frame, lambda *_: None)
+        chunk = b"".join(frames) * 100
+        per_chunk = len(frames) * 100
+        rounds = max(1, lines // per_chunk)
+        cpu_start = time.process_time()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            framer.data_received(chunk)
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_start
+    finally:
+        await client.disconnect()
+
+    total = rounds * per_chunk
+    return {
+        "lines": total,
+        "lines_per_second": round(total / elapsed),
+        "cpu_us_per_line": round(cpu / total * 1_000_000, 3),
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _captured_frames(path: Path) -> tuple[bytes, ...]:
+    _, records = load_capture(path)
+    frames = tuple(record.data + b"\r" for record in records if record.kind == "rx")
+    if not frames:
+        raise ValueError(f"{path} contains no received frames")
+    return frames
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    frames = UNSOLICITED_LINES if args.capture is None else _captured_frames(args.capture)
+    config = EmulatorConfig(latency=args.latency, jitter=args.jitter, seed=args.seed)
+    async with AvrEmulator(config=config) as emulator:
+        results = {
+            "poll_base": await _async_bench_poll(emulator, False, args.polls),
+            "poll_extended": await _async_bench_poll(emulator, True, args.polls),
+            "command_throughput": await _async_bench_throughput(emulator, args.commands),
+            "command_during_poll": await _async_bench_command_during_poll(
+                emulator, args.samples, args.seed
+            ),
+            "unsolicited_parse": await _async_bench_unsolicited(emulator, args.lines, frames),
+        }
+
+    return {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "emulator": {"latency": args.latency, "jitter": args.jitter, "seed": args.seed},
+        "capture": None if args.capture is None else str(args.capture),
+        "results": results,
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.005, help="emulated reply delay")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random reply delay")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--polls", type=int, default=20, help="polls per poll scenario")
+    parser.add_argument("--commands", type=int, default=200, help="commands for throughput")
+    parser.add_argument("--samples", type=int, default=100, help="commands issued during polls")
+    parser.add_argument("--lines", type=int, default=100_000, help="unsolicited lines to parse")
+    parser.add_argument(
+        "--capture",
+        type=Path,
+        help="parse the frames received in this capture instead of the built-in sample",
+    )
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    report = json.dumps(asyncio.run(async_run(args)), indent=2)
+    if args.output is None:
+        sys.stdout.write(report + "\n")
+    else:
+        args.output.write_text(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""Replay AVR traffic recorded with the ``start_capture`` service.
+
+Run ``python tools/replay_capture.py capture.jsonl --port 2323 --speed 4`` and
+point the integration (or ``DenonMarantzClient``) at ``127.0.0.1:2323``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from _integration import load
+
+const = load("const")
+
+_LOGGER = logging.getLogger("replay_capture")
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureRecord:
+    t: float
+    kind: str
+    data: bytes = b""
+
+
+def load_capture(path: Path) -> tuple[dict[str, Any], list[CaptureRecord]]:
+    with path.open(encoding="ascii") as capture:
+        header = json.loads(capture.readline())
+        if header.get("format") != const.CAPTURE_FORMAT:
+            raise ValueError(f"{path} is not a {const.CAPTURE_FORMAT} file")
+        if header.get("version") != const.CAPTURE_VERSION:
+            raise ValueError(f"Unsupported capture version {header.get('version')}")
+        records = [
+            CaptureRecord(item["t"], item["kind"], item.get("data", "").encode("latin-1"))
+            for item in map(json.loads, capture)
+        ]
+    return header, records
+
+
+def split_sessions(records: Sequence[CaptureRecord]) -> list[list[CaptureRecord]]:
+    sessions: list[list[CaptureRecord]] = []
+    for record in records:
+        if record.kind == "connect" or not sessions:
+            sessions.append([])
+        sessions[-1].append(record)
+        if record.kind == "disconnect":
+            sessions.append([])
+    return [session for session in sessions if any(r.kind != "disconnect" for r in session)]
+
+
+class CaptureReplayServer:
+    def __init__(
+        self,
+        records: Sequence[CaptureRecord],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        speed: float = 1.0,
+        reactive: bool = True,
+        request_timeout: float = 5.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.speed = speed
+        self.reactive = reactive
+        self.request_timeout = request_timeout
+        self.finished = asyncio.Event()
+        self.unmatched_requests = 0
+        self._sessions = deque(split_sessions(records))
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._server: asyncio.Server | None = None
+        if not self._sessions:
+            self.finished.set()
+
+    async def __aenter__(self) -> CaptureReplayServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        for writer in list(self._writers):
+            writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        if not self._sessions:
+            writer.close()
+            return
+
+        session = self._sessions.popleft()
+        self._writers.add(writer)
+        received: deque[bytes] = deque()
+        arrived = asyncio.Event()
+        reader_task = asyncio.get_running_loop().create_task(
+            self._async_read_requests(reader, received, arrived)
+        )
+        try:
+            await self._async_replay_session(session, writer, received, arrived)
+            if not self._sessions:
+                self.finished.set()
+            await reader_task
+        finally:
+            reader_task.cancel()
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _async_read_requests(
+        self,
+        reader: asyncio.StreamReader,
+        received: deque[bytes],
+        arrived: asyncio.Event,
+    ) -> None:
+        with contextlib.suppress(ConnectionError, asyncio.IncompleteReadError):
+            while True:
+                line = (await reader.readuntil(b"\r"))[:-1]
+                received.append(line.strip())
+                arrived.set()
+
+    async def _async_replay_session(
+        self,
+        session: list[CaptureRecord],
+        writer: asyncio.StreamWriter,
+        received: deque[bytes],
+        arrived: asyncio.Event,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        origin = session[0].t
+        started = loop.time()
+        for record in session:
+            due = started + (record.t - origin) / self.speed
+            if record.kind == "tx":
+                if not self.reactive:
+                    continue
+                for request in filter(None, record.data.split(b"\r")):
+                    if not await self._async_wait_for_request(request, received, arrived):
+                        self.unmatched_requests += 1
+                started = max(started, loop.time() - (record.t - origin) / self.speed)
+                continue
+
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if record.kind == "rx":
+                writer.write(record.data + b"\r")
+                await writer.drain()
+            elif record.kind == "disconnect":
+                writer.transport.abort()
+                return
+
+    async def _async_wait_for_request(
+        self,
+        request: bytes,
+        received: deque[bytes],
+        arrived: asyncio.Event,
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.request_timeout
+        while True:
+            while received:
+                if received.popleft() == request.strip():
+                    return True
+            arrived.clear()
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                _LOGGER.warning("Client never sent %s; continuing", request)
+                return False
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(arrived.wait(), remaining)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2323)
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier")
+    parser.add_argument(
+        "--timed",
+        action="store_true",
+        help="send replies on the recorded schedule instead of waiting for each request",
+    )
+    parser.add_argument(
+        "--request-timeout",
+        type=float,
+        default=5.0,
+        help="seconds to wait for a recorded request before moving on",
+    )
+    return parser.parse_args(argv)
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    header, records = load_capture(args.capture)
+    server = CaptureReplayServer(
+        records,
+        args.host,
+        args.port,
+        speed=args.speed,
+        reactive=not args.timed,
+        request_timeout=args.request_timeout,
+    )
+    await server.start()
+    print(
+        f"Replaying {len(records)} records captured from {header.get('host')} "
+        f"on {server.host}:{server.port}"
+    )
+    await server.finished.wait()
+    await server.stop()
+    print(f"Replay finished; {server.unmatched_requests} recorded requests were not sent")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(_parse_args()))